@@ -1,6 +1,14 @@
 """Product catalog for the demo coffee shop."""
 
-from backend.schemas.checkout import Item
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
+from backend.schemas.checkout import FulfillmentOption, Item
+
+# Shared/interned strings: every catalog item carries the same currency and
+# items reuse a handful of image paths, so keep one canonical copy of each.
+_USD = sys.intern("USD")
 
 # Demo product catalog for "Cymbal Coffee Shop"
 CATALOG: dict[str, Item] = {
@@ -8,121 +16,136 @@ CATALOG: dict[str, Item] = {
         id="coffee_small",
         title="Small Coffee",
         description="8oz freshly brewed coffee",
-        image_url="/images/coffee.jpeg",
+        image_url=sys.intern("/images/coffee.jpeg"),
         price=299,
-        currency="USD",
+        currency=_USD,
     ),
     "coffee_medium": Item(
         id="coffee_medium",
         title="Medium Coffee",
         description="12oz freshly brewed coffee",
-        image_url="/images/coffee.jpeg",
+        image_url=sys.intern("/images/coffee.jpeg"),
         price=399,
-        currency="USD",
+        currency=_USD,
     ),
     "coffee_large": Item(
         id="coffee_large",
         title="Large Coffee",
         description="16oz freshly brewed coffee",
-        image_url="/images/coffee.jpeg",
+        image_url=sys.intern("/images/coffee.jpeg"),
         price=499,
-        currency="USD",
+        currency=_USD,
     ),
     "latte_medium": Item(
         id="latte_medium",
         title="Medium Latte",
         description="12oz espresso with steamed milk",
-        image_url="/images/latte.jpeg",
+        image_url=sys.intern("/images/latte.jpeg"),
         price=549,
-        currency="USD",
+        currency=_USD,
     ),
     "latte_large": Item(
         id="latte_large",
         title="Large Latte",
         description="16oz espresso with steamed milk",
-        image_url="/images/latte.jpeg",
+        image_url=sys.intern("/images/latte.jpeg"),
         price=649,
-        currency="USD",
+        currency=_USD,
     ),
     "cappuccino": Item(
         id="cappuccino",
         title="Cappuccino",
         description="Espresso with foamed milk",
-        image_url="/images/cappuccino.jpeg",
+        image_url=sys.intern("/images/cappuccino.jpeg"),
         price=549,
-        currency="USD",
+        currency=_USD,
     ),
     "espresso_single": Item(
         id="espresso_single",
         title="Single Espresso",
         description="Single shot of espresso",
-        image_url="/images/espresso.jpeg",
+        image_url=sys.intern("/images/espresso.jpeg"),
         price=299,
-        currency="USD",
+        currency=_USD,
     ),
     "espresso_double": Item(
         id="espresso_double",
         title="Double Espresso",
         description="Double shot of espresso",
-        image_url="/images/espresso.jpeg",
+        image_url=sys.intern("/images/espresso.jpeg"),
         price=399,
-        currency="USD",
+        currency=_USD,
     ),
     "muffin_blueberry": Item(
         id="muffin_blueberry",
         title="Blueberry Muffin",
         description="Fresh baked blueberry muffin",
-        image_url="/images/muffin_blueberry.jpeg",
+        image_url=sys.intern("/images/muffin_blueberry.jpeg"),
         price=349,
-        currency="USD",
+        currency=_USD,
     ),
     "muffin_chocolate": Item(
         id="muffin_chocolate",
         title="Chocolate Chip Muffin",
         description="Fresh baked chocolate chip muffin",
-        image_url="/images/muffin_chocolate.jpeg",
+        image_url=sys.intern("/images/muffin_chocolate.jpeg"),
         price=349,
-        currency="USD",
+        currency=_USD,
     ),
     "croissant": Item(
         id="croissant",
         title="Butter Croissant",
         description="Flaky butter croissant",
-        image_url="/images/croissant.jpeg",
+        image_url=sys.intern("/images/croissant.jpeg"),
         price=399,
-        currency="USD",
+        currency=_USD,
     ),
     "bagel": Item(
         id="bagel",
         title="Everything Bagel",
         description="Everything bagel with cream cheese",
-        image_url="/images/bagel.jpeg",
+        image_url=sys.intern("/images/bagel.jpeg"),
         price=449,
-        currency="USD",
+        currency=_USD,
     ),
 }
 
-# Available discount codes
-DISCOUNT_CODES: dict[str, dict] = {
-    "DEMO20": {
-        "title": "Demo Discount",
-        "type": "percentage",
-        "value": 20,  # 20% off
-    },
-    "SAVE5": {
-        "title": "Save $5",
-        "type": "fixed",
-        "value": 500,  # $5 off in cents
-    },
-    "FREESHIP": {
-        "title": "Free Shipping",
-        "type": "free_shipping",
-        "value": 0,
-    },
-}
+# Catalog serialized once at import time; the catalog is static, so hot read
+# endpoints can serve these dicts without per-request model_dump() calls.
+# price_display is preformatted here so responses never re-format static
+# prices (integer math keeps the cents exact).
+PRODUCTS_DUMP: list[dict] = [
+    {
+        **item.model_dump(),
+        "price_display": f"${item.price // 100}.{item.price % 100:02d}",
+    }
+    for item in CATALOG.values()
+]
 
-# Fulfillment options
-FULFILLMENT_OPTIONS = [
+# Available discount codes. Read-only view: the codes are fixed demo data
+# and several derived indexes below assume they never change after import.
+DISCOUNT_CODES: MappingProxyType = MappingProxyType(
+    {
+        "DEMO20": {
+            "title": "Demo Discount",
+            "type": "percentage",
+            "value": 20,  # 20% off
+        },
+        "SAVE5": {
+            "title": "Save $5",
+            "type": "fixed",
+            "value": 500,  # $5 off in cents
+        },
+        "FREESHIP": {
+            "title": "Free Shipping",
+            "type": "free_shipping",
+            "value": 0,
+        },
+    }
+)
+
+# Fulfillment options; a tuple for the same reason DISCOUNT_CODES is a proxy.
+FULFILLMENT_OPTIONS = (
     {
         "id": "pickup",
         "title": "In-Store Pickup",
@@ -144,7 +167,21 @@ FULFILLMENT_OPTIONS = [
         "price": 899,
         "estimated_delivery": "15-20 minutes",
     },
-]
+)
+
+# Validated FulfillmentOption models, built once at import time so checkout
+# handlers don't re-run Pydantic validation on the same static dicts per
+# request. A tuple to match Fulfillment.available_options' annotation.
+FULFILLMENT_OPTION_MODELS = tuple(
+    FulfillmentOption(**opt) for opt in FULFILLMENT_OPTIONS
+)
+
+# Option id -> price index so totals calculation avoids a linear scan.
+FULFILLMENT_PRICES: dict[str, int] = {o["id"]: o["price"] for o in FULFILLMENT_OPTIONS}
+
+# Normalized discount-code index; guards against future mixed-case entries in
+# DISCOUNT_CODES so lookups stay a single dict hit.
+_DISCOUNT_LOOKUP: dict[str, dict] = {k.upper(): v for k, v in DISCOUNT_CODES.items()}
 
 
 def get_product(product_id: str) -> Item | None:
@@ -152,16 +189,25 @@ def get_product(product_id: str) -> Item | None:
     return CATALOG.get(product_id)
 
 
+@lru_cache(maxsize=1)
 def get_all_products() -> list[Item]:
-    """Get all products in the catalog."""
+    """Get all products in the catalog.
+
+    The catalog is immutable (frozen Items, fixed at import), so the list
+    is built once and shared across callers.
+    """
     return list(CATALOG.values())
 
 
 def validate_discount_code(code: str) -> dict | None:
-    """Validate a discount code and return its details."""
-    return DISCOUNT_CODES.get(code.upper())
+    """Validate a discount code and return its details.
+
+    Codes are matched case-insensitively and surrounding whitespace
+    (a common user-input error) is ignored.
+    """
+    return _DISCOUNT_LOOKUP.get(code.strip().upper())
 
 
-def get_fulfillment_options() -> list[dict]:
+def get_fulfillment_options() -> tuple[dict, ...]:
     """Get available fulfillment options."""
     return FULFILLMENT_OPTIONS
@@ -1,25 +1,30 @@
 """Checkout capability handlers for UCP."""
 
 import uuid
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from cachetools import LRUCache, TTLCache
 from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import Response
 
 from backend.business.catalog import (
-    FULFILLMENT_OPTIONS,
+    FULFILLMENT_OPTION_MODELS,
+    FULFILLMENT_PRICES,
     get_product,
     validate_discount_code,
 )
 from backend.schemas.checkout import (
+    Buyer,
     CheckoutSession,
     CheckoutStatus,
     CompleteCheckoutRequest,
     CreateCheckoutRequest,
     Discount,
     Fulfillment,
-    FulfillmentOption,
     LineItem,
+    LineItemRequest,
     Link,
     Message,
     MessageSeverity,
@@ -32,25 +37,111 @@ from backend.schemas.ucp import UCPResponseMetadata
 
 router = APIRouter(prefix="/api/v1")
 
-# In-memory storage for checkout sessions (demo purposes)
-checkout_sessions: dict[str, dict] = {}
+
+@dataclass(slots=True)
+class SessionData:
+    """Server-side mutable state backing one checkout session.
+
+    A slotted dataclass rather than a dict: the session store can hold up
+    to 100k of these for a day, and slots drop the per-object __dict__
+    while turning field reads into attribute loads instead of hashed key
+    lookups.
+    """
+
+    id: str
+    line_items: list[LineItem]
+    buyer: Buyer | None
+    fulfillment: Fulfillment | None
+    discounts: list[Discount]
+    status: CheckoutStatus | None
+    order: OrderConfirmation | None
+    created_at: datetime
+    updated_at: datetime
+    expires_at: datetime
+
+# In-memory storage for checkout sessions (demo purposes). Bounded with a TTL
+# matching the 24h expires_at stamped on each session so abandoned checkouts
+# don't accumulate for the lifetime of the process.
+checkout_sessions: TTLCache = TTLCache(maxsize=100_000, ttl=86400)
+
+# Memoized responses keyed by session id; entries are (updated_at, response).
+# Write paths always bump updated_at, which implicitly invalidates the entry.
+_response_cache: LRUCache = LRUCache(maxsize=1024)
+
+# Serialized response bodies, same keying. Populated only by the HTTP
+# handlers, so in-process callers (the agent's UCP client) never pay for
+# JSON they don't send.
+_response_bytes_cache: LRUCache = LRUCache(maxsize=1024)
+
+# UCP metadata is identical for every response - build it once at import time
+# instead of re-validating the nested capability dicts per request.
+_UCP_METADATA = UCPResponseMetadata(
+    version="2026-01-11",
+    capabilities={
+        "dev.ucp.shopping.checkout": [{"version": "2026-01-11"}],
+        "dev.ucp.shopping.fulfillment": [{"version": "2026-01-11"}],
+        "dev.ucp.shopping.discount": [{"version": "2026-01-11"}],
+    },
+    payment_handlers={
+        "dev.ucp.demo.mock_tokenizer": [
+            {"id": "mock_tokenizer_001", "version": "2026-01-11"}
+        ]
+    },
+)
+
+# Static business policy links shared by every checkout response.
+_STATIC_LINKS = (
+    Link(
+        type="privacy_policy",
+        href="https://example.com/privacy",
+        title="Privacy Policy",
+    ),
+    Link(
+        type="terms_of_service",
+        href="https://example.com/terms",
+        title="Terms of Service",
+    ),
+)
+
+
+# Mock payment tokens are valid for 15 minutes.
+_TOKEN_TTL = timedelta(minutes=15)
+
+# Delivery options that require a shipping address.
+_DELIVERY_OPTION_IDS = frozenset({"standard", "express"})
+
+# Statuses in which a session can no longer be modified.
+_TERMINAL_STATUSES = frozenset({CheckoutStatus.COMPLETED, CheckoutStatus.CANCELED})
+
+# Canonical checkout-state messages. Message is frozen, so these singletons
+# can be appended to any response without per-request construction.
+_MSG_EMPTY_CART = Message(
+    type=MessageType.WARNING,
+    code="empty_cart",
+    content="Your cart is empty. Add some items to continue.",
+)
+_MSG_SELECT_FULFILLMENT = Message(
+    type=MessageType.INFO,
+    code="select_fulfillment",
+    content="Please select a fulfillment option.",
+)
+_MSG_FULFILLMENT_REQUIRED = Message(
+    type=MessageType.ERROR,
+    code="fulfillment_required",
+    content="Please select a fulfillment option to continue.",
+    severity=MessageSeverity.RECOVERABLE,
+)
+_MSG_ADDRESS_REQUIRED = Message(
+    type=MessageType.ERROR,
+    code="address_required",
+    content="Please provide a delivery address.",
+    severity=MessageSeverity.RECOVERABLE,
+)
 
 
 def get_ucp_metadata() -> UCPResponseMetadata:
     """Get UCP metadata for responses."""
-    return UCPResponseMetadata(
-        version="2026-01-11",
-        capabilities={
-            "dev.ucp.shopping.checkout": [{"version": "2026-01-11"}],
-            "dev.ucp.shopping.fulfillment": [{"version": "2026-01-11"}],
-            "dev.ucp.shopping.discount": [{"version": "2026-01-11"}],
-        },
-        payment_handlers={
-            "dev.ucp.demo.mock_tokenizer": [
-                {"id": "mock_tokenizer_001", "version": "2026-01-11"}
-            ]
-        },
-    )
+    return _UCP_METADATA
 
 
 def calculate_totals(
@@ -64,29 +155,25 @@ def calculate_totals(
     # Calculate discount
     discount_amount = sum(d.amount for d in discounts)
 
-    # Calculate shipping
+    # Calculate shipping (codes are upper-cased at insert time)
     shipping = 0
     if fulfillment and fulfillment.selected_option_id:
-        for opt in FULFILLMENT_OPTIONS:
-            if opt["id"] == fulfillment.selected_option_id:
-                # Check for free shipping discount
-                has_free_shipping = any(d.code.upper() == "FREESHIP" for d in discounts)
-                if not has_free_shipping:
-                    shipping = opt["price"]
-                break
-
-    # Calculate tax (demo: 8% on subtotal after discount)
-    taxable = max(0, subtotal - discount_amount)
-    tax = int(taxable * 0.08)
+        discount_codes = {d.code for d in discounts}
+        if "FREESHIP" not in discount_codes:
+            shipping = FULFILLMENT_PRICES.get(fulfillment.selected_option_id, 0)
 
-    total = subtotal - discount_amount + shipping + tax
+    # Calculate tax (demo: 8% on subtotal after discount); pure integer math
+    # keeps the cents arithmetic exact and float-free.
+    taxable = max(0, subtotal - discount_amount)
+    tax = (taxable * 8) // 100
 
-    return Total(
+    # All inputs are computed internally, so skip Pydantic validation; the
+    # final total is a computed field derived from these components.
+    return Total.model_construct(
         subtotal=subtotal,
         discount=discount_amount,
         shipping=shipping,
         tax=tax,
-        total=max(0, total),
         currency="USD",
     )
 
@@ -127,7 +214,7 @@ def determine_status(
         return CheckoutStatus.INCOMPLETE
 
     # Check if shipping address is provided for delivery options
-    if fulfillment.selected_option_id in ["standard", "express"]:
+    if fulfillment.selected_option_id in _DELIVERY_OPTION_IDS:
         if fulfillment.address is None:
             return CheckoutStatus.INCOMPLETE
 
@@ -142,106 +229,102 @@ def build_messages(
     messages = []
 
     if not line_items:
-        messages.append(
-            Message(
-                type=MessageType.WARNING,
-                code="empty_cart",
-                content="Your cart is empty. Add some items to continue.",
-            )
-        )
+        messages.append(_MSG_EMPTY_CART)
 
     if fulfillment is None:
-        messages.append(
-            Message(
-                type=MessageType.INFO,
-                code="select_fulfillment",
-                content="Please select a fulfillment option.",
-            )
-        )
+        messages.append(_MSG_SELECT_FULFILLMENT)
     elif fulfillment.selected_option_id is None:
-        messages.append(
-            Message(
-                type=MessageType.ERROR,
-                code="fulfillment_required",
-                content="Please select a fulfillment option to continue.",
-                severity=MessageSeverity.RECOVERABLE,
-            )
-        )
-    elif fulfillment.selected_option_id in ["standard", "express"]:
+        messages.append(_MSG_FULFILLMENT_REQUIRED)
+    elif fulfillment.selected_option_id in _DELIVERY_OPTION_IDS:
         if fulfillment.address is None:
-            messages.append(
-                Message(
-                    type=MessageType.ERROR,
-                    code="address_required",
-                    content="Please provide a delivery address.",
-                    severity=MessageSeverity.RECOVERABLE,
-                )
-            )
+            messages.append(_MSG_ADDRESS_REQUIRED)
 
     return messages
 
 
-def build_checkout_response(session_data: dict) -> CheckoutSession:
+def build_checkout_response(session_data: SessionData) -> CheckoutSession:
     """Build a CheckoutSession response from stored data."""
-    line_items = session_data.get("line_items", [])
-    discounts = session_data.get("discounts", [])
-    fulfillment = session_data.get("fulfillment")
+    session_id = session_data.id
+    updated_at = session_data.updated_at
+
+    # Repeat reads of an unchanged session return the memoized response
+    cached = _response_cache.get(session_id)
+    if cached is not None and cached[0] == updated_at:
+        return cached[1]
+
+    line_items = session_data.line_items
+    discounts = session_data.discounts
+    fulfillment = session_data.fulfillment
 
     messages = build_messages(line_items, fulfillment)
-    status = session_data.get("status")
+    status = session_data.status
 
     # If not completed/canceled, recalculate status
-    if status not in [CheckoutStatus.COMPLETED, CheckoutStatus.CANCELED]:
+    if status not in _TERMINAL_STATUSES:
         status = determine_status(line_items, fulfillment, messages)
 
     totals = calculate_totals(line_items, discounts, fulfillment)
 
-    return CheckoutSession(
+    response = CheckoutSession(
         ucp=get_ucp_metadata(),
-        id=session_data["id"],
+        id=session_id,
         status=status,
         line_items=line_items,
-        buyer=session_data.get("buyer"),
+        buyer=session_data.buyer,
         fulfillment=fulfillment,
         discounts=discounts,
         totals=totals,
         messages=messages,
-        links=[
-            Link(
-                type="privacy_policy",
-                href="https://example.com/privacy",
-                title="Privacy Policy",
-            ),
-            Link(
-                type="terms_of_service",
-                href="https://example.com/terms",
-                title="Terms of Service",
-            ),
-        ],
-        continue_url=f"http://localhost:8000/checkout/{session_data['id']}",
-        expires_at=session_data.get("expires_at"),
-        order=session_data.get("order"),
-        created_at=session_data["created_at"],
-        updated_at=session_data["updated_at"],
+        links=_STATIC_LINKS,
+        continue_url=f"http://localhost:8000/checkout/{session_id}",
+        expires_at=session_data.expires_at,
+        order=session_data.order,
+        created_at=session_data.created_at,
+        updated_at=updated_at,
     )
+    _response_cache[session_id] = (updated_at, response)
+    return response
 
 
-@router.post("/checkout-sessions", response_model=CheckoutSession)
-async def create_checkout(
-    request: CreateCheckoutRequest,
-    ucp_agent: str | None = Header(default=None, alias="UCP-Agent"),
-) -> CheckoutSession:
-    """Create a new checkout session.
+def checkout_response(session_data: SessionData) -> Response:
+    """Build the HTTP response for a session from pre-serialized bytes.
 
-    This initiates a checkout session with the provided items.
-    The platform should call this when a user expresses purchase intent.
+    FastAPI runs jsonable_encoder over any model a handler returns, which
+    walks every field of the CheckoutSession per request. Serializing once
+    with Pydantic's Rust-backed model_dump_json and memoizing the bytes lets
+    repeat reads skip both the encoder walk and the JSON encode.
     """
-    session_id = f"cs_{uuid.uuid4().hex[:16]}"
-    now = datetime.now(timezone.utc)
+    session_id = session_data.id
+    updated_at = session_data.updated_at
+
+    cached = _response_bytes_cache.get(session_id)
+    if cached is not None and cached[0] == updated_at:
+        body = cached[1]
+    else:
+        body = build_checkout_response(session_data).model_dump_json().encode()
+        _response_bytes_cache[session_id] = (updated_at, body)
+
+    return Response(content=body, media_type="application/json")
+
+
+# The checkout endpoints return already-validated CheckoutSession models, so
+# response_model is disabled (None) to skip FastAPI's second validation pass
+# over every field on the way out; the handlers hand back raw bytes via
+# checkout_response.
+
 
-    # Process line items
+def _build_line_items(item_requests: list[LineItemRequest]) -> list[LineItem]:
+    """Resolve requested items against the catalog into LineItem models.
+
+    One RNG draw per request seeds every line-item ID; a per-item uuid4()
+    would hit the OS entropy pool once per item.
+
+    Raises:
+        HTTPException: 400 if a product id is unknown.
+    """
+    item_id_seed = uuid.uuid4().hex[:6]
     line_items: list[LineItem] = []
-    for i, item_req in enumerate(request.line_items):
+    for i, item_req in enumerate(item_requests):
         product = get_product(item_req.product_id)
         if product is None:
             raise HTTPException(
@@ -249,100 +332,127 @@ async def create_checkout(
                 detail=f"Product not found: {item_req.product_id}",
             )
 
+        # Fields come from a validated catalog Item plus a validated request
+        # quantity, so construction skips re-validation.
         line_items.append(
-            LineItem(
-                id=f"li_{uuid.uuid4().hex[:8]}",
+            LineItem.model_construct(
+                id=f"li_{item_id_seed}{i:02x}",
                 product_id=product.id,
                 title=product.title,
                 description=product.description,
                 image_url=product.image_url,
                 quantity=item_req.quantity,
                 unit_price=product.price,
-                total_price=product.price * item_req.quantity,
                 currency=product.currency,
             )
         )
+    return line_items
+
 
-    # Process discount codes
+def _build_discounts(codes: list[str], subtotal: int) -> list[Discount]:
+    """Validate discount codes and build Discount models against a subtotal.
+
+    Unknown codes are silently skipped, matching UCP's lenient discount
+    semantics. The subtotal is passed in so it is computed exactly once.
+    """
     discounts: list[Discount] = []
-    for code in request.discount_codes:
+    for code in codes:
+        # Normalize once; model_construct bypasses Discount's normalizing
+        # validator, and calculate_totals compares stored codes exactly
+        code = code.strip().upper()
         discount_info = validate_discount_code(code)
         if discount_info:
-            # Calculate discount amount
-            subtotal = sum(item.total_price for item in line_items)
             if discount_info["type"] == "percentage":
-                amount = int(subtotal * discount_info["value"] / 100)
+                amount = (subtotal * discount_info["value"]) // 100
             elif discount_info["type"] == "fixed":
                 amount = min(discount_info["value"], subtotal)
             else:
                 amount = 0
 
             discounts.append(
-                Discount(
-                    code=code.upper(),
+                Discount.model_construct(
+                    code=code,
                     title=discount_info["title"],
                     amount=amount,
                     currency="USD",
                 )
             )
+    return discounts
+
 
-    # Build fulfillment with available options
-    fulfillment = Fulfillment(
+@router.post("/checkout-sessions", response_model=None)
+async def create_checkout(
+    request: CreateCheckoutRequest,
+    ucp_agent: str | None = Header(default=None, alias="UCP-Agent"),
+) -> Response:
+    """Create a new checkout session.
+
+    This initiates a checkout session with the provided items.
+    The platform should call this when a user expresses purchase intent.
+    """
+    session_id = f"cs_{uuid.uuid4().hex[:16]}"
+    now = datetime.now(timezone.utc)
+
+    # Process line items and discount codes
+    line_items = _build_line_items(request.line_items)
+    subtotal = sum(item.total_price for item in line_items)
+    discounts = _build_discounts(request.discount_codes, subtotal)
+
+    # Build fulfillment with available options (validated at the request
+    # boundary already, so construct directly)
+    fulfillment = Fulfillment.model_construct(
         type="shipping",
         address=request.fulfillment.address if request.fulfillment else None,
         selected_option_id=(
             request.fulfillment.selected_option_id if request.fulfillment else None
         ),
-        available_options=[FulfillmentOption(**opt) for opt in FULFILLMENT_OPTIONS],
+        available_options=FULFILLMENT_OPTION_MODELS,
     )
 
     # Store session
-    session_data = {
-        "id": session_id,
-        "line_items": line_items,
-        "buyer": request.buyer,
-        "fulfillment": fulfillment,
-        "discounts": discounts,
-        "status": None,  # Will be calculated
-        "order": None,
-        "created_at": now,
-        "updated_at": now,
-        "expires_at": now + timedelta(hours=24),
-    }
+    session_data = SessionData(
+        id=session_id,
+        line_items=line_items,
+        buyer=request.buyer,
+        fulfillment=fulfillment,
+        discounts=discounts,
+        status=None,  # Will be calculated
+        order=None,
+        created_at=now,
+        updated_at=now,
+        expires_at=now + timedelta(hours=24),
+    )
     checkout_sessions[session_id] = session_data
 
-    return build_checkout_response(session_data)
+    return checkout_response(session_data)
 
 
-@router.get("/checkout-sessions/{session_id}", response_model=CheckoutSession)
-async def get_checkout(session_id: str) -> CheckoutSession:
+@router.get("/checkout-sessions/{session_id}", response_model=None)
+async def get_checkout(session_id: str) -> Response:
     """Get the current state of a checkout session."""
-    if session_id not in checkout_sessions:
+    session_data = checkout_sessions.get(session_id)
+    if session_data is None:
         raise HTTPException(status_code=404, detail="Checkout session not found")
 
-    return build_checkout_response(checkout_sessions[session_id])
+    return checkout_response(session_data)
 
 
-@router.put("/checkout-sessions/{session_id}", response_model=CheckoutSession)
+@router.put("/checkout-sessions/{session_id}", response_model=None)
 async def update_checkout(
     session_id: str,
     request: UpdateCheckoutRequest,
-) -> CheckoutSession:
+) -> Response:
     """Update an existing checkout session.
 
     This performs a full replacement of the checkout session state.
     The platform must send the complete state including any updates.
     """
-    if session_id not in checkout_sessions:
+    session_data = checkout_sessions.get(session_id)
+    if session_data is None:
         raise HTTPException(status_code=404, detail="Checkout session not found")
 
-    session_data = checkout_sessions[session_id]
-
     # Check if session can be updated
-    if session_data.get("status") in [
-        CheckoutStatus.COMPLETED,
-        CheckoutStatus.CANCELED,
-    ]:
+    if session_data.status in _TERMINAL_STATUSES:
         raise HTTPException(
             status_code=400,
             detail="Cannot update a completed or canceled checkout session",
@@ -350,99 +460,53 @@ async def update_checkout(
 
     now = datetime.now(timezone.utc)
 
-    # Process line items
-    line_items: list[LineItem] = []
-    for item_req in request.line_items:
-        product = get_product(item_req.product_id)
-        if product is None:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Product not found: {item_req.product_id}",
-            )
-
-        line_items.append(
-            LineItem(
-                id=f"li_{uuid.uuid4().hex[:8]}",
-                product_id=product.id,
-                title=product.title,
-                description=product.description,
-                image_url=product.image_url,
-                quantity=item_req.quantity,
-                unit_price=product.price,
-                total_price=product.price * item_req.quantity,
-                currency=product.currency,
-            )
-        )
-
-    # Process discount codes
-    discounts: list[Discount] = []
-    for code in request.discount_codes:
-        discount_info = validate_discount_code(code)
-        if discount_info:
-            subtotal = sum(item.total_price for item in line_items)
-            if discount_info["type"] == "percentage":
-                amount = int(subtotal * discount_info["value"] / 100)
-            elif discount_info["type"] == "fixed":
-                amount = min(discount_info["value"], subtotal)
-            else:
-                amount = 0
-
-            discounts.append(
-                Discount(
-                    code=code.upper(),
-                    title=discount_info["title"],
-                    amount=amount,
-                    currency="USD",
-                )
-            )
+    # Process line items and discount codes
+    line_items = _build_line_items(request.line_items)
+    subtotal = sum(item.total_price for item in line_items)
+    discounts = _build_discounts(request.discount_codes, subtotal)
 
     # Build fulfillment
     fulfillment = None
     if request.fulfillment:
-        fulfillment = Fulfillment(
+        fulfillment = Fulfillment.model_construct(
             type="shipping",
             address=request.fulfillment.address,
             selected_option_id=request.fulfillment.selected_option_id,
-            available_options=[FulfillmentOption(**opt) for opt in FULFILLMENT_OPTIONS],
+            available_options=FULFILLMENT_OPTION_MODELS,
         )
 
     # Update session
-    session_data.update(
-        {
-            "line_items": line_items,
-            "buyer": request.buyer,
-            "fulfillment": fulfillment,
-            "discounts": discounts,
-            "updated_at": now,
-        }
-    )
+    session_data.line_items = line_items
+    session_data.buyer = request.buyer
+    session_data.fulfillment = fulfillment
+    session_data.discounts = discounts
+    session_data.updated_at = now
 
-    return build_checkout_response(session_data)
+    return checkout_response(session_data)
 
 
-@router.post("/checkout-sessions/{session_id}/complete", response_model=CheckoutSession)
+@router.post("/checkout-sessions/{session_id}/complete", response_model=None)
 async def complete_checkout(
     session_id: str,
     request: CompleteCheckoutRequest,
-) -> CheckoutSession:
+) -> Response:
     """Complete the checkout and place the order.
 
     This finalizes the checkout session. The payment information
     should include instruments acquired from the payment handler.
     """
-    if session_id not in checkout_sessions:
+    session_data = checkout_sessions.get(session_id)
+    if session_data is None:
         raise HTTPException(status_code=404, detail="Checkout session not found")
 
-    session_data = checkout_sessions[session_id]
-
     # Check if session can be completed
-    if session_data.get("status") == CheckoutStatus.COMPLETED:
+    if session_data.status == CheckoutStatus.COMPLETED:
         raise HTTPException(
             status_code=400,
             detail="Checkout session is already completed",
         )
 
-    if session_data.get("status") == CheckoutStatus.CANCELED:
+    if session_data.status == CheckoutStatus.CANCELED:
         raise HTTPException(
             status_code=400,
             detail="Cannot complete a canceled checkout session",
@@ -457,41 +521,37 @@ async def complete_checkout(
 
     now = datetime.now(timezone.utc)
 
-    # Create order
+    # Create order (single uuid draw; the permalink must reference the same id)
+    order_id = f"ord_{uuid.uuid4().hex[:12]}"
     order = OrderConfirmation(
-        id=f"ord_{uuid.uuid4().hex[:12]}",
-        permalink_url=f"http://localhost:8000/orders/ord_{uuid.uuid4().hex[:12]}",
+        id=order_id,
+        permalink_url=f"http://localhost:8000/orders/{order_id}",
         created_at=now,
     )
 
     # Update session
-    session_data.update(
-        {
-            "status": CheckoutStatus.COMPLETED,
-            "order": order,
-            "updated_at": now,
-        }
-    )
+    session_data.status = CheckoutStatus.COMPLETED
+    session_data.order = order
+    session_data.updated_at = now
 
-    return build_checkout_response(session_data)
+    return checkout_response(session_data)
 
 
-@router.post("/checkout-sessions/{session_id}/cancel", response_model=CheckoutSession)
-async def cancel_checkout(session_id: str) -> CheckoutSession:
+@router.post("/checkout-sessions/{session_id}/cancel", response_model=None)
+async def cancel_checkout(session_id: str) -> Response:
     """Cancel a checkout session."""
-    if session_id not in checkout_sessions:
+    session_data = checkout_sessions.get(session_id)
+    if session_data is None:
         raise HTTPException(status_code=404, detail="Checkout session not found")
 
-    session_data = checkout_sessions[session_id]
-
     # Check if session can be canceled
-    if session_data.get("status") == CheckoutStatus.COMPLETED:
+    if session_data.status == CheckoutStatus.COMPLETED:
         raise HTTPException(
             status_code=400,
             detail="Cannot cancel a completed checkout session",
         )
 
-    if session_data.get("status") == CheckoutStatus.CANCELED:
+    if session_data.status == CheckoutStatus.CANCELED:
         raise HTTPException(
             status_code=400,
             detail="Checkout session is already canceled",
@@ -500,14 +560,10 @@ async def cancel_checkout(session_id: str) -> CheckoutSession:
     now = datetime.now(timezone.utc)
 
     # Update session
-    session_data.update(
-        {
-            "status": CheckoutStatus.CANCELED,
-            "updated_at": now,
-        }
-    )
+    session_data.status = CheckoutStatus.CANCELED
+    session_data.updated_at = now
 
-    return build_checkout_response(session_data)
+    return checkout_response(session_data)
 
 
 @router.get("/products")
@@ -516,10 +572,9 @@ async def list_products() -> list[dict]:
 
     This is a convenience endpoint for the demo, not part of UCP spec.
     """
-    from backend.business.catalog import get_all_products
+    from backend.business.catalog import PRODUCTS_DUMP
 
-    products = get_all_products()
-    return [p.model_dump() for p in products]
+    return PRODUCTS_DUMP
 
 
 @router.post("/tokenize")
@@ -532,5 +587,5 @@ async def mock_tokenize(request: dict[str, Any]) -> dict:
     return {
         "token": f"tok_{uuid.uuid4().hex[:16]}",
         "type": "TOKEN",
-        "expires_at": (datetime.now(timezone.utc) + timedelta(minutes=15)).isoformat(),
+        "expires_at": (datetime.now(timezone.utc) + _TOKEN_TTL).isoformat(),
     }
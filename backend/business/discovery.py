@@ -1,17 +1,40 @@
 """UCP Discovery endpoint for business profile."""
 
+import hashlib
 import os
+from functools import lru_cache
 
-from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, Header
+from fastapi.responses import Response
 
 from backend.schemas.discovery import create_demo_business_profile
 
 router = APIRouter()
 
 
+@lru_cache(maxsize=4)
+def _profile_bytes(business_url: str, business_name: str) -> tuple[bytes, str]:
+    """Serialize the business profile once per (url, name) pair.
+
+    The profile is static for a given configuration, so there's no need to
+    rebuild and re-dump the Pydantic model on every discovery request.
+    Returns the JSON bytes together with their ETag so revalidation
+    requests can be answered with a 304 instead of the full body.
+    """
+    profile = create_demo_business_profile(
+        business_url=business_url,
+        business_name=business_name,
+    )
+    body = orjson.dumps(profile.model_dump(by_alias=True, exclude_none=True))
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    return body, etag
+
+
 @router.get("/.well-known/ucp")
-async def get_ucp_profile() -> JSONResponse:
+async def get_ucp_profile(
+    if_none_match: str | None = Header(default=None),
+) -> Response:
     """Return the business's UCP profile for discovery.
 
     This endpoint is the entry point for UCP capability discovery.
@@ -21,25 +44,24 @@ async def get_ucp_profile() -> JSONResponse:
     - What payment handlers are configured
 
     Returns:
-        JSONResponse: The business's UCP profile
+        Response: The business's UCP profile as prebuilt JSON bytes, or an
+        empty 304 when the caller's If-None-Match ETag still matches
     """
     business_url = os.getenv("BUSINESS_URL", "http://localhost:8000")
     business_name = os.getenv("BUSINESS_NAME", "Cymbal Coffee Shop")
 
-    profile = create_demo_business_profile(
-        business_url=business_url,
-        business_name=business_name,
-    )
-
-    # Convert to dict and use proper JSON serialization
-    profile_dict = profile.model_dump(by_alias=True, exclude_none=True)
+    body, etag = _profile_bytes(business_url, business_name)
+    headers = {
+        "Cache-Control": "public, max-age=3600",  # Cache for 1 hour
+        "ETag": etag,
+    }
+    if if_none_match == etag:
+        return Response(status_code=304, headers=headers)
 
-    return JSONResponse(
-        content=profile_dict,
-        headers={
-            "Content-Type": "application/json",
-            "Cache-Control": "public, max-age=3600",  # Cache for 1 hour
-        },
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=headers,
     )
 
 
@@ -1,14 +1,22 @@
 """Main FastAPI application for UCP Demo."""
 
-import json
+import asyncio
+import logging
 import os
 import time
 from contextlib import asynccontextmanager
+from functools import partial
 
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import (
+    JSONResponse,
+    ORJSONResponse,
+    Response,
+    StreamingResponse,
+)
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from backend.business.server import router as business_router
@@ -17,12 +25,44 @@ from backend.visualizer.events import (
     EventType,
     capture_request,
     capture_response,
+    event_store,
 )
+from backend.visualizer.websocket import event_broadcaster
 from backend.visualizer.websocket import router as visualizer_router
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Prebuilt /health payload; load balancers poll this endpoint constantly and
+# it never changes, so skip JSON encoding entirely.
+_HEALTH_BYTES = b'{"status":"healthy"}'
+
+# Bounded queue feeding the capture worker so event capture never blocks the
+# request path; if the worker falls behind, events are dropped, not requests.
+_capture_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+
+
+def _enqueue_capture(capture_call) -> None:
+    """Queue a zero-arg capture callable for the background worker."""
+    try:
+        _capture_queue.put_nowait(capture_call)
+    except asyncio.QueueFull:
+        logger.warning("Event capture queue full; dropping event")
+
+
+async def _capture_worker() -> None:
+    """Drain the capture queue, logging (not losing) any failures."""
+    while True:
+        capture_call = await _capture_queue.get()
+        try:
+            capture_call()
+        except Exception:
+            logger.exception("Event capture failed")
+        finally:
+            _capture_queue.task_done()
+
 
 def get_event_type(path: str, method: str) -> EventType | None:
     """Determine the event type based on path and method.
@@ -42,6 +82,8 @@ class EventCaptureMiddleware(BaseHTTPMiddleware):
 
     async def dispatch(self, request: Request, call_next):
         path = request.url.path
+        if path == "/health":
+            return await call_next(request)
         method = request.method
 
         # Only capture UCP-related paths
@@ -53,49 +95,61 @@ class EventCaptureMiddleware(BaseHTTPMiddleware):
         start_time = time.time()
         try:
             body = await request.body()
-            body_json = json.loads(body) if body else None
+            body_json = orjson.loads(body) if body else None
         except Exception:
             body_json = None
 
-        request_id = capture_request(
-            event_type=event_type,
-            method=method,
-            path=path,
-            headers=dict(request.headers),
-            body=body_json,
+        # Pre-allocate the event ID so the response capture can reference it,
+        # then hand the actual capture off to the background worker.
+        request_id = event_store.next_id()
+        _enqueue_capture(
+            partial(
+                capture_request,
+                event_type=event_type,
+                method=method,
+                path=path,
+                headers=dict(request.headers),
+                body=body_json,
+                event_id=request_id,
+            )
         )
 
         # Call the actual endpoint
         response = await call_next(request)
 
-        # Capture response
-        duration_ms = (time.time() - start_time) * 1000
-
-        # Read response body for capture
-        response_body = b""
-        async for chunk in response.body_iterator:
-            response_body += chunk
-
-        try:
-            response_json = json.loads(response_body) if response_body else None
-        except Exception:
-            response_json = None
-
-        capture_response(
-            request_id=request_id,
-            event_type=event_type,
-            method=method,
-            path=path,
-            status_code=response.status_code,
-            body=response_json,
-            duration_ms=round(duration_ms, 2),
-        )
-
-        # Return a new response with the same body
-        return JSONResponse(
-            content=response_json,
+        # Tee the response body to the capture sink while streaming it to the
+        # client unchanged - no second buffering or JSON re-encoding pass.
+        async def capture_stream():
+            chunks: list[bytes] = []
+            async for chunk in response.body_iterator:
+                chunks.append(chunk)
+                yield chunk
+
+            duration_ms = (time.time() - start_time) * 1000
+            response_body = b"".join(chunks)
+            try:
+                response_json = orjson.loads(response_body) if response_body else None
+            except Exception:
+                response_json = None
+
+            _enqueue_capture(
+                partial(
+                    capture_response,
+                    request_id=request_id,
+                    event_type=event_type,
+                    method=method,
+                    path=path,
+                    status_code=response.status_code,
+                    body=response_json,
+                    duration_ms=round(duration_ms, 2),
+                )
+            )
+
+        return StreamingResponse(
+            capture_stream(),
             status_code=response.status_code,
             headers=dict(response.headers),
+            media_type=response.media_type,
         )
 
 
@@ -108,8 +162,12 @@ async def lifespan(app: FastAPI):
     print(f"Business: {os.getenv('BUSINESS_NAME', 'Cymbal Coffee Shop')}")
     print("Discovery endpoint: http://localhost:8000/.well-known/ucp")
     print("=" * 60)
+    capture_task = asyncio.create_task(_capture_worker())
+    broadcaster_task = asyncio.create_task(event_broadcaster())
     yield
     # Shutdown
+    capture_task.cancel()
+    broadcaster_task.cancel()
     print("UCP Demo Server Shutting Down...")
 
 
@@ -118,6 +176,7 @@ app = FastAPI(
     description="Interactive demonstration of the Universal Commerce Protocol",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -129,8 +188,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Event capture middleware for UCP protocol visualization
-app.add_middleware(EventCaptureMiddleware)
+# Event capture middleware for UCP protocol visualization. Agent tools emit
+# all UCP events today (see get_event_type), so the middleware is opt-in:
+# registering a no-op middleware still costs an extra coroutine hop per request.
+if os.getenv("UCP_CAPTURE_HTTP") == "1":
+    app.add_middleware(EventCaptureMiddleware)
 
 # Include routers
 app.include_router(business_router)
@@ -164,7 +226,7 @@ async def root():
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 # Error handler
@@ -4,8 +4,14 @@ This agent follows Google ADK patterns with proper ToolContext-based state manag
 and dynamically retrieves data from the UCP client instead of hardcoding values.
 """
 
+import asyncio
 import logging
 import os
+import queue
+import re
+import threading
+import time
+from functools import cache, lru_cache
 from typing import Any
 
 from google.adk.agents import Agent
@@ -17,7 +23,7 @@ from google.adk.tools.tool_context import ToolContext
 from google.genai import types
 
 from backend.platform.ucp_client import UCPClient
-from backend.schemas.checkout import CheckoutStatus
+from backend.schemas.checkout import CheckoutSession, CheckoutStatus
 from backend.visualizer.events import (
     EventType,
     capture_agent_tool_call,
@@ -29,20 +35,35 @@ from backend.visualizer.events import (
 # State keys following ADK patterns (prefix with user: for session-scoped data)
 ADK_USER_CHECKOUT_ID = "user:checkout_id"
 ADK_PRODUCTS_CACHE = "user:products_cache"
+ADK_CHECKOUT_CACHE = "user:checkout_cache"
+ADK_EMITTED_EVENTS = "user:emitted_events"
 ADK_UCP_DISCOVERED = "user:ucp_discovered"
 ADK_LATEST_TOOL_RESULT = "temp:LATEST_TOOL_RESULT"
+ADK_LATEST_TOOL_RESULT_SEQ = "temp:LATEST_TOOL_RESULT_SEQ"
+ADK_LAST_RETURNED_SEQ = "temp:last_returned_seq"
+ADK_TOOL_CALL_ID = "temp:tool_call_id"
 
 # Response keys for UCP data
 UCP_CHECKOUT_KEY = "a2a.ucp.checkout"
 UCP_PRODUCTS_KEY = "a2a.ucp.products"
 
+# Tool-response keys worth echoing into the visualizer result summary
+_SUMMARY_KEYS = ("status", "message", "items", "totals", "new_total", "order")
+
 logger = logging.getLogger(__name__)
 
-# Global UCP client instance (initialized by ShoppingAgentService)
-_ucp_client: UCPClient | None = None
+# Monotonic ns clock for duration measurement: cheaper than time.time() and
+# immune to wall-clock adjustments.
+_now = time.perf_counter_ns
 
-# Track which events have been emitted this session to avoid duplicates
-_emitted_events: set[str] = set()
+# Shared UCP client instance, built eagerly so the tool hot path is a plain
+# module read with no None-check or lock. Construction is trivial (no I/O);
+# ShoppingAgentService swaps it out when configured with another business URL.
+_ucp_client: UCPClient = UCPClient("http://localhost:8000")
+# Visualizer events are emitted off the tool path: _emit_event enqueues and a
+# daemon thread performs the actual capture, so event fan-out never adds
+# latency to a tool response.
+_event_queue: queue.SimpleQueue = queue.SimpleQueue()
 
 
 def _emit_event(
@@ -52,49 +73,109 @@ def _emit_event(
     request_body: dict | None = None,
     response_body: dict | None = None,
     status_code: int = 200,
+    duration_ms: float = 0.0,
 ) -> None:
-    """Emit a protocol event for visualization."""
-    import time
-
-    start = time.time()
-    request_id = capture_request(
-        event_type=event_type,
-        method=method,
-        path=path,
-        headers={"X-UCP-Agent": "cymbal_coffee_agent"},
-        body=request_body,
-    )
-    duration_ms = (time.time() - start) * 1000
-    capture_response(
-        request_id=request_id,
-        event_type=event_type,
-        method=method,
-        path=path,
-        status_code=status_code,
-        body=response_body,
-        duration_ms=round(duration_ms, 2),
+    """Queue a protocol event for visualization.
+
+    ``duration_ms`` should be measured by the caller around the actual
+    client call the event describes.
+
+    ``response_body`` stays a dict rather than pre-encoded bytes: callers
+    already share one ``model_dump`` between the emit, the tool's return
+    payload, and the session-state cache, and the visualizer needs the dict
+    shape for display formatting - encoding here would add a pass, not
+    remove one.
+    """
+    _event_queue.put(
+        (event_type, method, path, request_body, response_body, status_code,
+         duration_ms)
     )
 
 
-def _reset_emitted_events() -> None:
-    """Reset the emitted events tracker (call on session reset)."""
-    global _emitted_events
-    _emitted_events = set()
+def _event_worker() -> None:
+    """Drain the emit queue, capturing request/response event pairs."""
+    while True:
+        (event_type, method, path, request_body, response_body, status_code,
+         duration_ms) = _event_queue.get()
+        try:
+            request_id = capture_request(
+                event_type=event_type,
+                method=method,
+                path=path,
+                headers={"X-UCP-Agent": "cymbal_coffee_agent"},
+                body=request_body,
+            )
+            capture_response(
+                request_id=request_id,
+                event_type=event_type,
+                method=method,
+                path=path,
+                status_code=status_code,
+                body=response_body,
+                duration_ms=duration_ms,
+            )
+        except Exception:
+            logger.exception("Visualizer event emit failed")
+
+
+_event_worker_thread = threading.Thread(
+    target=_event_worker, name="ucp-event-emit", daemon=True
+)
+_event_worker_thread.start()
 
 
 def _get_ucp_client() -> UCPClient:
-    """Get the global UCP client instance."""
-    global _ucp_client
-    if _ucp_client is None:
-        _ucp_client = UCPClient("http://localhost:8000")
+    """Get the shared UCP client instance."""
     return _ucp_client
 
 
+@lru_cache(maxsize=4096)
+def _fmt_cents(cents: int) -> str:
+    """Format minor units as dollars with pure integer math.
+
+    Prices repeat heavily (menu items, shipping costs), so the LRU turns
+    most formats into a dict hit with no float round-trip.
+    """
+    dollars, rem = divmod(cents, 100)
+    return f"${dollars}.{rem:02d}"
+
+
+def _fmt_cents_or_free(cents: int) -> str:
+    """Like _fmt_cents, but renders zero as "Free" (shipping options)."""
+    return "Free" if cents == 0 else _fmt_cents(cents)
+
+
 def _create_error_response(message: str) -> dict:
     """Create a standardized error response."""
     return {"message": message, "status": "error"}
 
 
+def _cache_checkout(tool_context: ToolContext, checkout: CheckoutSession) -> dict:
+    """Store the latest checkout in session state; returns the JSON dump."""
+    dumped = checkout.model_dump(mode="json")
+    tool_context.state[ADK_CHECKOUT_CACHE] = dumped
+    return dumped
+
+
+def _load_checkout(
+    tool_context: ToolContext,
+    client: UCPClient,
+    checkout_id: str,
+) -> CheckoutSession:
+    """Return the cached checkout for this session, fetching only on a miss.
+
+    Every tool that receives a checkout refreshes the cache via
+    _cache_checkout, so the speculative GET at the top of most tools
+    becomes a state read.
+    """
+    cached = tool_context.state.get(ADK_CHECKOUT_CACHE)
+    if cached and cached.get("id") == checkout_id:
+        return CheckoutSession.model_validate(cached)
+    checkout = client.get_checkout(checkout_id)
+    _cache_checkout(tool_context, checkout)
+    return checkout
+
+
 # ============================================================================
 # TOOL DEFINITIONS
 # Tools follow ADK pattern: sync functions with ToolContext as first parameter
@@ -113,8 +194,7 @@ def show_menu(tool_context: ToolContext) -> dict:
     Returns:
         dict: Product catalog with available items.
     """
-    global _emitted_events
-    print(f"[AGENT] show_menu called, _emitted_events={_emitted_events}")
+    logger.debug("show_menu called")
     try:
         client = _get_ucp_client()
 
@@ -122,18 +202,20 @@ def show_menu(tool_context: ToolContext) -> dict:
         if not client._discovered:
             client.discover()
 
-        # Emit discovery event only once
-        if "discovery" not in _emitted_events:
-            _emitted_events.add("discovery")
-            print("[AGENT] Emitting discovery event (first time)")
+        # Session-scoped tracker of one-shot events (stored as a list so the
+        # session state stays JSON-serializable)
+        emitted = tool_context.state.get(ADK_EMITTED_EVENTS) or []
+
+        # Emit discovery event only once per session
+        if "discovery" not in emitted:
+            emitted = [*emitted, "discovery"]
+            tool_context.state[ADK_EMITTED_EVENTS] = emitted
             _emit_event(
                 EventType.DISCOVERY,
                 "GET",
                 "/.well-known/ucp",
                 response_body={"capabilities": client.get_capabilities()},
             )
-        else:
-            print("[AGENT] Skipping discovery event (already emitted)")
 
         # Get products (use cache if available, only emit event once)
         products = tool_context.state.get(ADK_PRODUCTS_CACHE)
@@ -141,18 +223,15 @@ def show_menu(tool_context: ToolContext) -> dict:
             products = client.get_products()
             tool_context.state[ADK_PRODUCTS_CACHE] = products
 
-        # Emit products event only once
-        if "products" not in _emitted_events:
-            _emitted_events.add("products")
-            print("[AGENT] Emitting products event (first time)")
+        # Emit products event only once per session
+        if "products" not in emitted:
+            tool_context.state[ADK_EMITTED_EVENTS] = [*emitted, "products"]
             _emit_event(
                 EventType.GET_PRODUCTS,
                 "GET",
                 "/api/v1/products",
                 response_body={"products": products},
             )
-        else:
-            print("[AGENT] Skipping products event (already emitted)")
 
         # Format products for display
         product_list = []
@@ -162,7 +241,7 @@ def show_menu(tool_context: ToolContext) -> dict:
                     "id": p["id"],
                     "title": p["title"],
                     "description": p.get("description"),
-                    "price": f"${p['price'] / 100:.2f}",
+                    "price": p["price_display"],
                 }
             )
 
@@ -200,66 +279,64 @@ def add_to_cart(
     checkout_id = tool_context.state.get(ADK_USER_CHECKOUT_ID)
 
     try:
-        # Get current cart items if checkout exists
-        current_items = []
+        new_items = [{"product_id": product_id, "quantity": quantity}]
+
+        # Update via a delta patch: the server merges quantities against its
+        # authoritative cart, so no GET + client-side merge is needed
+        checkout = None
         if checkout_id:
             try:
-                checkout = client.get_checkout(checkout_id)
-                current_items = [
-                    {"product_id": li.product_id, "quantity": li.quantity}
-                    for li in checkout.line_items
-                ]
-            except Exception:
-                checkout_id = None
+                start = _now()
+                checkout = client.patch_checkout(
+                    checkout_id, add_line_items=new_items
+                )
+                duration_ms = round((_now() - start) / 1_000_000, 2)
+            except ValueError as exc:
+                if "session not found" not in str(exc).lower():
+                    raise
+                # Checkout expired - recover by creating a fresh one below
                 tool_context.state[ADK_USER_CHECKOUT_ID] = None
 
-        # Merge items
-        item_map = {item["product_id"]: item["quantity"] for item in current_items}
-        item_map[product_id] = item_map.get(product_id, 0) + quantity
-
-        merged_items = [
-            {"product_id": pid, "quantity": qty} for pid, qty in item_map.items()
-        ]
-
-        # Create or update checkout
-        if checkout_id:
-            checkout = client.update_checkout(
-                checkout_id,
-                line_items=merged_items,
-            )
+        if checkout is not None:
+            dumped = _cache_checkout(tool_context, checkout)
             # Emit update event
             _emit_event(
                 EventType.UPDATE_CHECKOUT,
-                "PUT",
+                "PATCH",
                 f"/api/v1/checkout-sessions/{checkout_id}",
-                request_body={"line_items": merged_items},
-                response_body=checkout.model_dump(mode="json"),
+                request_body={"add_line_items": new_items},
+                response_body=dumped,
+                duration_ms=duration_ms,
             )
         else:
-            checkout = client.create_checkout(line_items=merged_items)
+            start = _now()
+            checkout = client.create_checkout(line_items=new_items)
+            duration_ms = round((_now() - start) / 1_000_000, 2)
             tool_context.state[ADK_USER_CHECKOUT_ID] = checkout.id
+            dumped = _cache_checkout(tool_context, checkout)
             # Emit create event
             _emit_event(
                 EventType.CREATE_CHECKOUT,
                 "POST",
                 "/api/v1/checkout-sessions",
-                request_body={"line_items": merged_items},
-                response_body=checkout.model_dump(mode="json"),
+                request_body={"line_items": new_items},
+                response_body=dumped,
+                duration_ms=duration_ms,
             )
 
         # Format response with DYNAMIC fulfillment options from checkout
         response = {
-            UCP_CHECKOUT_KEY: checkout.model_dump(mode="json"),
+            UCP_CHECKOUT_KEY: dumped,
             "status": "success",
             "items": [
                 {
                     "title": li.title,
                     "quantity": li.quantity,
-                    "price": f"${li.total_price / 100:.2f}",
+                    "price": _fmt_cents(li.total_price),
                 }
                 for li in checkout.line_items
             ],
-            "subtotal": f"${checkout.totals.subtotal / 100:.2f}"
+            "subtotal": _fmt_cents(checkout.totals.subtotal)
             if checkout.totals
             else None,
         }
@@ -270,7 +347,7 @@ def add_to_cart(
                 {
                     "id": opt.id,
                     "title": opt.title,
-                    "price": f"${opt.price / 100:.2f}" if opt.price > 0 else "Free",
+                    "price": _fmt_cents_or_free(opt.price),
                     "delivery": opt.estimated_delivery,
                 }
                 for opt in checkout.fulfillment.available_options
@@ -307,27 +384,31 @@ def view_cart(tool_context: ToolContext) -> dict:
 
     try:
         client = _get_ucp_client()
-        checkout = client.get_checkout(checkout_id)
+        start = _now()
+        checkout = _load_checkout(tool_context, client, checkout_id)
+        duration_ms = round((_now() - start) / 1_000_000, 2)
+        dumped = _cache_checkout(tool_context, checkout)
         # Emit get checkout event
         _emit_event(
             EventType.GET_CHECKOUT,
             "GET",
             f"/api/v1/checkout-sessions/{checkout_id}",
-            response_body=checkout.model_dump(mode="json"),
+            response_body=dumped,
+            duration_ms=duration_ms,
         )
     except Exception as e:
         return {"error": str(e), "status": "error"}
 
     result = {
-        UCP_CHECKOUT_KEY: checkout.model_dump(mode="json"),
+        UCP_CHECKOUT_KEY: dumped,
         "checkout_id": checkout.id,
-        "checkout_status": checkout.status.value,
+        "checkout_status": checkout.status,
         "status": "success",
         "items": [
             {
                 "title": li.title,
                 "quantity": li.quantity,
-                "price": f"${li.total_price / 100:.2f}",
+                "price": _fmt_cents(li.total_price),
             }
             for li in checkout.line_items
         ],
@@ -335,11 +416,11 @@ def view_cart(tool_context: ToolContext) -> dict:
 
     if checkout.totals:
         result["totals"] = {
-            "subtotal": f"${checkout.totals.subtotal / 100:.2f}",
-            "discount": f"${checkout.totals.discount / 100:.2f}",
-            "shipping": f"${checkout.totals.shipping / 100:.2f}",
-            "tax": f"${checkout.totals.tax / 100:.2f}",
-            "total": f"${checkout.totals.total / 100:.2f}",
+            "subtotal": _fmt_cents(checkout.totals.subtotal),
+            "discount": _fmt_cents(checkout.totals.discount),
+            "shipping": _fmt_cents(checkout.totals.shipping),
+            "tax": _fmt_cents(checkout.totals.tax),
+            "total": _fmt_cents(checkout.totals.total),
         }
 
     # IMPORTANT: Include available shipping options dynamically
@@ -348,7 +429,7 @@ def view_cart(tool_context: ToolContext) -> dict:
             {
                 "id": opt.id,
                 "title": opt.title,
-                "price": f"${opt.price / 100:.2f}" if opt.price > 0 else "Free",
+                "price": _fmt_cents_or_free(opt.price),
                 "delivery": opt.estimated_delivery,
             }
             for opt in checkout.fulfillment.available_options
@@ -357,18 +438,69 @@ def view_cart(tool_context: ToolContext) -> dict:
 
     if checkout.discounts:
         result["discounts"] = [
-            {"code": d.code, "title": d.title, "amount": f"${d.amount / 100:.2f}"}
+            {"code": d.code, "title": d.title, "amount": _fmt_cents(d.amount)}
             for d in checkout.discounts
         ]
 
     if checkout.messages:
         result["messages"] = [
-            {"type": m.type.value, "content": m.content} for m in checkout.messages
+            {"type": m.type, "content": m.content} for m in checkout.messages
         ]
 
     return result
 
 
+def _do_select_shipping(
+    tool_context: ToolContext,
+    checkout_id: str,
+    option_id: str,
+) -> tuple[CheckoutSession, dict]:
+    """Patch the fulfillment selection and return the updated checkout.
+
+    Shared by select_shipping and complete_checkout's pickup auto-select so
+    the latter can consume the fresh checkout directly instead of
+    re-fetching it. Returns the checkout model and its JSON dump.
+    """
+    client = _get_ucp_client()
+
+    fulfillment_data = {"selected_option_id": option_id}
+
+    # For non-pickup options, provide a demo address if none exists.
+    # The patch preserves any stored address, so only the fallback needs
+    # sending; the session's cached checkout (user-scoped, maintained by
+    # _cache_checkout — temp: state doesn't survive to this turn) tells
+    # us whether one exists.
+    if option_id != "pickup":
+        cached = tool_context.state.get(ADK_CHECKOUT_CACHE) or {}
+        cached_checkout = cached if cached.get("id") == checkout_id else {}
+        cached_fulfillment = cached_checkout.get("fulfillment") or {}
+        if not cached_fulfillment.get("address"):
+            # Default demo address for delivery options
+            fulfillment_data["address"] = {
+                "street_address": "123 Demo Street",
+                "address_locality": "San Francisco",
+                "address_region": "CA",
+                "postal_code": "94102",
+                "address_country": "US",
+            }
+
+    # Single delta call; no read-modify-write of the full checkout state
+    start = _now()
+    checkout = client.patch_checkout(checkout_id, fulfillment=fulfillment_data)
+    duration_ms = round((_now() - start) / 1_000_000, 2)
+    dumped = _cache_checkout(tool_context, checkout)
+    # Emit update event for shipping selection
+    _emit_event(
+        EventType.UPDATE_CHECKOUT,
+        "PATCH",
+        f"/api/v1/checkout-sessions/{checkout_id}",
+        request_body={"fulfillment": fulfillment_data},
+        response_body=dumped,
+        duration_ms=duration_ms,
+    )
+    return checkout, dumped
+
+
 def select_shipping(tool_context: ToolContext, option_id: str) -> dict:
     """Select a shipping/delivery option.
 
@@ -392,53 +524,18 @@ def select_shipping(tool_context: ToolContext, option_id: str) -> dict:
         )
 
     try:
-        client = _get_ucp_client()
-        current = client.get_checkout(checkout_id)
-
-        fulfillment_data = {"selected_option_id": option_id}
-
-        # For non-pickup options, provide a demo address if none exists
-        if option_id != "pickup":
-            if current.fulfillment and current.fulfillment.address:
-                fulfillment_data["address"] = current.fulfillment.address.model_dump()
-            else:
-                # Default demo address for delivery options
-                fulfillment_data["address"] = {
-                    "street_address": "123 Demo Street",
-                    "address_locality": "San Francisco",
-                    "address_region": "CA",
-                    "postal_code": "94102",
-                    "address_country": "US",
-                }
-
-        checkout = client.update_checkout(
-            checkout_id,
-            line_items=[
-                {"product_id": li.product_id, "quantity": li.quantity}
-                for li in current.line_items
-            ],
-            fulfillment=fulfillment_data,
-            discount_codes=[d.code for d in current.discounts],
-        )
-        # Emit update event for shipping selection
-        _emit_event(
-            EventType.UPDATE_CHECKOUT,
-            "PUT",
-            f"/api/v1/checkout-sessions/{checkout_id}",
-            request_body={"fulfillment": fulfillment_data},
-            response_body=checkout.model_dump(mode="json"),
-        )
+        checkout, dumped = _do_select_shipping(tool_context, checkout_id, option_id)
 
         # Get the selected option details dynamically
         selected_option = None
         if checkout.fulfillment and checkout.fulfillment.available_options:
-            for opt in checkout.fulfillment.available_options:
-                if opt.id == option_id:
-                    selected_option = opt
-                    break
+            options_by_id = {
+                opt.id: opt for opt in checkout.fulfillment.available_options
+            }
+            selected_option = options_by_id.get(option_id)
 
         return {
-            UCP_CHECKOUT_KEY: checkout.model_dump(mode="json"),
+            UCP_CHECKOUT_KEY: dumped,
             "status": "success",
             "selected_option": option_id,
             "selected_option_title": selected_option.title
@@ -447,13 +544,13 @@ def select_shipping(tool_context: ToolContext, option_id: str) -> dict:
             "selected_option_delivery": selected_option.estimated_delivery
             if selected_option
             else None,
-            "shipping_cost": f"${checkout.totals.shipping / 100:.2f}"
+            "shipping_cost": _fmt_cents(checkout.totals.shipping)
             if checkout.totals
             else None,
-            "new_total": f"${checkout.totals.total / 100:.2f}"
+            "new_total": _fmt_cents(checkout.totals.total)
             if checkout.totals
             else None,
-            "checkout_status": checkout.status.value,
+            "checkout_status": checkout.status,
         }
 
     except Exception:
@@ -480,55 +577,50 @@ def apply_discount(tool_context: ToolContext, code: str) -> dict:
 
     try:
         client = _get_ucp_client()
-        current = client.get_checkout(checkout_id)
 
-        # Check if already applied
-        existing_codes = [d.code for d in current.discounts]
-        if code.upper() in [c.upper() for c in existing_codes]:
+        # Stored codes are stripped and upper-cased, so normalize once here
+        code_upper = code.strip().upper()
+
+        # Check if already applied, against the session's cached checkout
+        # rather than a fresh GET (temp: state doesn't survive to this
+        # turn); the server dedupes codes anyway.
+        cached = tool_context.state.get(ADK_CHECKOUT_CACHE) or {}
+        cached_checkout = cached if cached.get("id") == checkout_id else {}
+        existing_codes = {d["code"] for d in cached_checkout.get("discounts", [])}
+        if code_upper in existing_codes:
             return {
                 "status": "already_applied",
                 "message": f"Code {code} already applied",
             }
 
-        # Update with new discount code
-        checkout = client.update_checkout(
-            checkout_id,
-            line_items=[
-                {"product_id": li.product_id, "quantity": li.quantity}
-                for li in current.line_items
-            ],
-            fulfillment={
-                "selected_option_id": current.fulfillment.selected_option_id,
-                "address": current.fulfillment.address.model_dump()
-                if current.fulfillment.address
-                else None,
-            }
-            if current.fulfillment
-            else None,
-            discount_codes=existing_codes + [code],
-        )
+        # Single delta call carrying just the new code
+        start = _now()
+        checkout = client.patch_checkout(checkout_id, add_discount_codes=[code])
+        duration_ms = round((_now() - start) / 1_000_000, 2)
+        dumped = _cache_checkout(tool_context, checkout)
 
         # Emit update event for discount
         _emit_event(
             EventType.UPDATE_CHECKOUT,
-            "PUT",
+            "PATCH",
             f"/api/v1/checkout-sessions/{checkout_id}",
-            request_body={"discount_codes": existing_codes + [code]},
-            response_body=checkout.model_dump(mode="json"),
+            request_body={"add_discount_codes": [code]},
+            response_body=dumped,
+            duration_ms=duration_ms,
         )
 
         # Check if the code was applied
-        applied = [d for d in checkout.discounts if d.code.upper() == code.upper()]
+        applied = next((d for d in checkout.discounts if d.code == code_upper), None)
         if applied:
             return {
-                UCP_CHECKOUT_KEY: checkout.model_dump(mode="json"),
+                UCP_CHECKOUT_KEY: dumped,
                 "status": "applied",
                 "discount": {
-                    "code": applied[0].code,
-                    "title": applied[0].title,
-                    "amount": f"${applied[0].amount / 100:.2f}",
+                    "code": applied.code,
+                    "title": applied.title,
+                    "amount": _fmt_cents(applied.amount),
                 },
-                "new_total": f"${checkout.totals.total / 100:.2f}"
+                "new_total": _fmt_cents(checkout.totals.total)
                 if checkout.totals
                 else None,
             }
@@ -559,19 +651,19 @@ def complete_checkout(tool_context: ToolContext) -> dict:
 
     try:
         client = _get_ucp_client()
-        current = client.get_checkout(checkout_id)
+        current = _load_checkout(tool_context, client, checkout_id)
 
-        # Auto-select pickup if no shipping selected
+        # Auto-select pickup if no shipping selected, consuming the updated
+        # checkout directly instead of re-fetching it
         if not current.fulfillment or not current.fulfillment.selected_option_id:
-            select_shipping(tool_context, "pickup")
-            current = client.get_checkout(checkout_id)
+            current, _ = _do_select_shipping(tool_context, checkout_id, "pickup")
 
         if current.status != CheckoutStatus.READY_FOR_COMPLETE:
             return {
                 "error": "Checkout is not ready to complete",
-                "status": current.status.value,
+                "status": current.status,
                 "messages": [
-                    m.content for m in current.messages if m.type.value == "error"
+                    m.content for m in current.messages if m.type == "error"
                 ],
             }
 
@@ -581,10 +673,12 @@ def complete_checkout(tool_context: ToolContext) -> dict:
             return _create_error_response("No payment handlers available")
 
         handler = handlers[0]
+        start = _now()
         token_response = client.tokenize_payment(
             handler["id"],
             {"demo": True},
         )
+        duration_ms = round((_now() - start) / 1_000_000, 2)
         # Emit tokenization event
         _emit_event(
             EventType.TOKENIZE,
@@ -592,6 +686,7 @@ def complete_checkout(tool_context: ToolContext) -> dict:
             "/api/v1/tokenize",
             request_body={"handler_id": handler["id"]},
             response_body=token_response,
+            duration_ms=duration_ms,
         )
 
         # Complete the checkout
@@ -607,30 +702,34 @@ def complete_checkout(tool_context: ToolContext) -> dict:
                 }
             ]
         }
+        start = _now()
         checkout = client.complete_checkout(
             checkout_id,
             payment=payment_data,
         )
+        duration_ms = round((_now() - start) / 1_000_000, 2)
+        dumped = _cache_checkout(tool_context, checkout)
         # Emit complete checkout event
         _emit_event(
             EventType.COMPLETE_CHECKOUT,
             "POST",
             f"/api/v1/checkout-sessions/{checkout_id}/complete",
             request_body={"payment": payment_data},
-            response_body=checkout.model_dump(mode="json"),
+            response_body=dumped,
+            duration_ms=duration_ms,
         )
 
         # NOTE: Don't clear checkout ID - keep it so the "completed" state
         # is visible in the UI. The checkout will be cleared on session reset.
 
         return {
-            UCP_CHECKOUT_KEY: checkout.model_dump(mode="json"),
+            UCP_CHECKOUT_KEY: dumped,
             "status": "completed",
             "order": {
                 "id": checkout.order.id if checkout.order else None,
                 "url": checkout.order.permalink_url if checkout.order else None,
             },
-            "total_charged": f"${checkout.totals.total / 100:.2f}"
+            "total_charged": _fmt_cents(checkout.totals.total)
             if checkout.totals
             else None,
         }
@@ -644,10 +743,6 @@ def complete_checkout(tool_context: ToolContext) -> dict:
 # CALLBACKS
 # ============================================================================
 
-# Track current tool call ID for matching results
-_current_tool_call_id: str | None = None
-
-
 def before_tool_callback(
     tool: BaseTool,
     args: dict[str, Any],
@@ -663,15 +758,15 @@ def before_tool_callback(
     Returns:
         dict | None: Return dict to skip tool execution, None to proceed.
     """
-    global _current_tool_call_id
     tool_name = tool.name if hasattr(tool, "name") else str(tool)
 
-    # Capture the tool call event
-    _current_tool_call_id = capture_agent_tool_call(
+    # Capture the tool call event; the ID is kept in temp state (not a module
+    # global) so concurrent tool calls can't attribute results to each other
+    tool_context.state[ADK_TOOL_CALL_ID] = capture_agent_tool_call(
         tool_name=tool_name,
         args=args,
     )
-    print(f"[AGENT] Tool call: {tool_name}({args})")
+    logger.debug("Tool call: %s(%s)", tool_name, args)
 
     # Return None to proceed with tool execution
     return None
@@ -694,44 +789,38 @@ def after_tool_modifier(
     Returns:
         dict | None: Modified response or None to keep original.
     """
-    global _current_tool_call_id
-
     tool_name = tool.name if hasattr(tool, "name") else str(tool)
 
     # Capture the tool result event
-    if _current_tool_call_id:
+    tool_call_id = tool_context.state.get(ADK_TOOL_CALL_ID)
+    if tool_call_id:
         # Create a summary of the result for display
-        result_summary = {}
-        if "status" in tool_response:
-            result_summary["status"] = tool_response["status"]
-        if "message" in tool_response:
-            result_summary["message"] = tool_response["message"]
+        result_summary = {
+            k: tool_response[k] for k in _SUMMARY_KEYS if k in tool_response
+        }
         if "products" in tool_response:
-            result_summary["products_count"] = len(tool_response.get("products", []))
-        if "items" in tool_response:
-            result_summary["items"] = tool_response["items"]
-        if "totals" in tool_response:
-            result_summary["totals"] = tool_response["totals"]
-        if "new_total" in tool_response:
-            result_summary["new_total"] = tool_response["new_total"]
-        if "order" in tool_response:
-            result_summary["order"] = tool_response["order"]
+            result_summary["products_count"] = len(tool_response["products"])
 
         capture_agent_tool_result(
-            tool_call_id=_current_tool_call_id,
+            tool_call_id=tool_call_id,
             tool_name=tool_name,
             result=result_summary
             if result_summary
             else {"raw": str(tool_response)[:200]},
             success=tool_response.get("status") != "error",
         )
-        _current_tool_call_id = None
+        tool_context.state[ADK_TOOL_CALL_ID] = None
 
     # Store UCP responses in state
     ucp_response_keys = [UCP_CHECKOUT_KEY, UCP_PRODUCTS_KEY]
 
     if any(key in tool_response for key in ucp_response_keys):
         tool_context.state[ADK_LATEST_TOOL_RESULT] = tool_response
+        # Bump the sequence so the after-agent callback knows this result
+        # hasn't been returned yet
+        tool_context.state[ADK_LATEST_TOOL_RESULT_SEQ] = (
+            tool_context.state.get(ADK_LATEST_TOOL_RESULT_SEQ, 0) + 1
+        )
 
     return None
 
@@ -750,18 +839,26 @@ def modify_output_after_agent(
         types.Content | None: Modified agent output, or None.
     """
     latest_result = callback_context.state.get(ADK_LATEST_TOOL_RESULT)
-    if latest_result:
-        return types.Content(
-            parts=[
-                types.Part(
-                    function_response=types.FunctionResponse(
-                        response={"result": latest_result}
-                    )
+    if not latest_result:
+        return None
+
+    # Plain text turns carry no new tool result; skip rebuilding the
+    # Content tree for a result the previous turn already returned
+    seq = callback_context.state.get(ADK_LATEST_TOOL_RESULT_SEQ, 0)
+    if seq == callback_context.state.get(ADK_LAST_RETURNED_SEQ):
+        return None
+    callback_context.state[ADK_LAST_RETURNED_SEQ] = seq
+
+    return types.Content(
+        parts=[
+            types.Part(
+                function_response=types.FunctionResponse(
+                    response={"result": latest_result}
                 )
-            ],
-            role="model",
-        )
-    return None
+            )
+        ],
+        role="model",
+    )
 
 
 # ============================================================================
@@ -769,52 +866,78 @@ def modify_output_after_agent(
 # ============================================================================
 
 
-root_agent = Agent(
-    name="cymbal_coffee_agent",
-    model="gemini-3-flash-preview",
-    description="AI shopping assistant for Cymbal Coffee Shop",
-    instruction=(
-        "You are a helpful shopping assistant for Cymbal Coffee Shop. "
-        "You help customers browse products, add items to cart, apply discounts, "
-        "select shipping, and complete orders.\n\n"
-        "CRITICAL - SHIPPING SELECTION:\n"
-        "When users say ANY of these after adding items to cart, they want to SELECT SHIPPING:\n"
-        "- 'the first', 'the second', 'the third', '1st', '2nd', '3rd'\n"
-        "- 'pickup', 'standard', 'express'\n"
-        "- 'option 1', 'option 2', 'option 3'\n"
-        "- Any number like '1', '2', '3'\n"
-        "Map these to shipping option IDs:\n"
-        "- 1st/first/pickup = 'pickup'\n"
-        "- 2nd/second/standard = 'standard'\n"
-        "- 3rd/third/express = 'express'\n"
-        "Use select_shipping with the correct option_id. Do NOT add items or show menu!\n\n"
-        "TOOL USAGE:\n"
-        "1. show_menu - When users ask about products/menu\n"
-        "2. add_to_cart - When users want to add specific items\n"
-        "3. view_cart - When users want to see their cart\n"
-        "4. select_shipping - When users choose delivery option (pickup/standard/express)\n"
-        "5. apply_discount - When users mention promo codes\n"
-        "6. complete_checkout - When users want to pay/checkout/complete order\n\n"
-        "Be helpful and conversational. Use the tools to get current data."
-    ),
-    tools=[
-        show_menu,
-        add_to_cart,
-        view_cart,
-        select_shipping,
-        apply_discount,
-        complete_checkout,
-    ],
-    before_tool_callback=before_tool_callback,
-    after_tool_callback=after_tool_modifier,
-    after_agent_callback=modify_output_after_agent,
+_INSTRUCTION = (
+    "You are a helpful shopping assistant for Cymbal Coffee Shop. "
+    "You help customers browse products, add items to cart, apply discounts, "
+    "select shipping, and complete orders.\n\n"
+    "CRITICAL - SHIPPING SELECTION:\n"
+    "When users say ANY of these after adding items to cart, they want to SELECT SHIPPING:\n"
+    "- 'the first', 'the second', 'the third', '1st', '2nd', '3rd'\n"
+    "- 'pickup', 'standard', 'express'\n"
+    "- 'option 1', 'option 2', 'option 3'\n"
+    "- Any number like '1', '2', '3'\n"
+    "Map these to shipping option IDs:\n"
+    "- 1st/first/pickup = 'pickup'\n"
+    "- 2nd/second/standard = 'standard'\n"
+    "- 3rd/third/express = 'express'\n"
+    "Use select_shipping with the correct option_id. Do NOT add items or show menu!\n\n"
+    "TOOL USAGE:\n"
+    "1. show_menu - When users ask about products/menu\n"
+    "2. add_to_cart - When users want to add specific items\n"
+    "3. view_cart - When users want to see their cart\n"
+    "4. select_shipping - When users choose delivery option (pickup/standard/express)\n"
+    "5. apply_discount - When users mention promo codes\n"
+    "6. complete_checkout - When users want to pay/checkout/complete order\n\n"
+    "Be helpful and conversational. Use the tools to get current data."
 )
 
+_TOOLS = [
+    show_menu,
+    add_to_cart,
+    view_cart,
+    select_shipping,
+    apply_discount,
+    complete_checkout,
+]
+
+
+@cache
+def get_root_agent() -> Agent:
+    """Build the shopping agent once, on first use.
+
+    Deferring construction keeps module import cheap; the cache gives every
+    caller the same Agent instance.
+    """
+    return Agent(
+        name="cymbal_coffee_agent",
+        model="gemini-3-flash-preview",
+        description="AI shopping assistant for Cymbal Coffee Shop",
+        instruction=_INSTRUCTION,
+        tools=_TOOLS,
+        before_tool_callback=before_tool_callback,
+        after_tool_callback=after_tool_modifier,
+        after_agent_callback=modify_output_after_agent,
+    )
+
 
 # ============================================================================
 # SERVICE CLASS (Wrapper for API endpoints)
 # ============================================================================
 
+# Fallback-mode keyword matcher and help text, built once at import time so
+# _fallback_chat doesn't rebuild the keyword list or the help string per call.
+_FALLBACK_MENU_RE = re.compile(r"\b(?:menu|products|browse|show)\b", re.IGNORECASE)
+
+_FALLBACK_HELP = """Hi! I'm your Cymbal Coffee Shop assistant. Here's what I can do:
+
+- **Show menu** - See all our drinks and food
+- **Add items** - "Add a latte to my cart"
+- **Apply discounts** - "Use code DEMO20"
+- **Select shipping** - "Pickup", "Standard", or "Express"
+- **Checkout** - Complete your order
+
+What would you like today?"""
+
 
 class ShoppingAgentService:
     """Service managing the ADK-based shopping agent.
@@ -852,7 +975,7 @@ class ShoppingAgentService:
         else:
             # Create the runner
             self._runner = Runner(
-                agent=root_agent,
+                agent=get_root_agent(),
                 app_name="cymbal_coffee_shop",
                 session_service=self._session_service,
             )
@@ -861,6 +984,12 @@ class ShoppingAgentService:
         self._products: list[dict] = []
         self._discovered = False
 
+        # Concurrency controls: one lock per session so two turns never
+        # mutate the same ADK session at once, plus an in-flight map that
+        # coalesces identical (session_id, message) requests onto one task.
+        self._session_locks: dict[str, asyncio.Lock] = {}
+        self._inflight: dict[tuple[str, str], asyncio.Task] = {}
+
     async def initialize(self) -> dict:
         """Initialize the agent by discovering the business."""
         self.ucp_client.discover()
@@ -878,16 +1007,49 @@ class ShoppingAgentService:
         self,
         message: str,
         session_id: str = "default",
-    ) -> tuple[str, list[dict] | None]:
+    ) -> tuple[str, list[dict] | None, str | None, bool]:
         """Process a chat message and return response with optional products.
 
+        Concurrent duplicates of the same (session_id, message) - a rapid
+        double-click or client retry - await the already-running turn
+        instead of spinning up a second LLM run, and turns within a session
+        are serialized by a per-session lock.
+
         Args:
             message: User's message
             session_id: Session ID for conversation continuity
 
         Returns:
-            Tuple of (response text, products list or None)
+            Tuple of (response text, products list or None, checkout id or
+            None, checkout touched). Surfacing the checkout id saves the
+            endpoint a second session fetch per turn; the touched flag lets
+            it skip the checkout fetch entirely on turns that never hit a
+            checkout tool.
         """
+        key = (session_id, message)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await inflight
+
+        lock = self._session_locks.setdefault(session_id, asyncio.Lock())
+
+        async def _locked_turn() -> tuple[str, list[dict] | None, str | None, bool]:
+            async with lock:
+                return await self._run_chat_turn(message, session_id)
+
+        task = asyncio.ensure_future(_locked_turn())
+        self._inflight[key] = task
+        try:
+            return await task
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _run_chat_turn(
+        self,
+        message: str,
+        session_id: str,
+    ) -> tuple[str, list[dict] | None, str | None, bool]:
+        """Run one agent turn; see chat_with_products for the contract."""
         if not self._discovered:
             await self.initialize()
 
@@ -909,8 +1071,13 @@ class ShoppingAgentService:
                     session_id=session_id,
                 )
 
-            # Collect final events from the agent run
-            final_events: list = []
+            # Extract text and data from final events as they stream, rather
+            # than buffering the event list and walking it a second time.
+            response_text = ""
+            products = None
+            data_found = False
+            checkout_touched = False
+            in_final = False
 
             async for event in self._runner.run_async(
                 user_id="demo_user",
@@ -920,74 +1087,85 @@ class ShoppingAgentService:
                     parts=[types.Part(text=message)],
                 ),
             ):
-                # Collect events after first final response
-                if event.is_final_response() or len(final_events) > 0:
-                    final_events.append(event)
-
-            # Process final events to extract text and data
-            response_text = ""
-            products = None
-            data_found = False
-
-            for final_event in final_events:
-                if not hasattr(final_event, "content") or not final_event.content:
+                # Only events from the first final response onward matter
+                in_final = in_final or event.is_final_response()
+                if not in_final:
+                    continue
+                content = getattr(event, "content", None)
+                if not content:
                     continue
 
-                for part in final_event.content.parts:
+                for part in content.parts:
                     # Check for function_response with data
-                    if hasattr(part, "function_response") and part.function_response:
-                        fr = part.function_response
-                        if hasattr(fr, "response") and fr.response:
-                            result = fr.response.get("result", fr.response)
+                    fr = getattr(part, "function_response", None)
+                    if fr is not None:
+                        response = getattr(fr, "response", None)
+                        if response:
+                            result = response.get("result", response)
                             if isinstance(result, dict):
                                 data_found = True
                                 # Extract products if present
                                 if UCP_PRODUCTS_KEY in result:
                                     products = result[UCP_PRODUCTS_KEY]
+                                if UCP_CHECKOUT_KEY in result:
+                                    checkout_touched = True
 
                     # Extract text content
-                    if hasattr(part, "text") and part.text:
-                        response_text += part.text
+                    text = getattr(part, "text", None)
+                    if text:
+                        response_text += text
+
+            # One session re-read to surface the checkout id (the pre-run
+            # session object is a copy, so its state is stale by now)
+            session = await self._session_service.get_session(
+                app_name="cymbal_coffee_shop",
+                user_id="demo_user",
+                session_id=session_id,
+            )
+            checkout_id = (
+                session.state.get(ADK_USER_CHECKOUT_ID) if session else None
+            )
 
             # If we have a response, return it
             if response_text:
-                return response_text, products
+                return response_text, products, checkout_id, checkout_touched
 
             # If no text but we processed data, return a default message
             if data_found:
-                return "Here's the information you requested.", products
+                return (
+                    "Here's the information you requested.",
+                    products,
+                    checkout_id,
+                    checkout_touched,
+                )
 
-            return "I'm here to help! Try saying 'show menu' to see our products.", None
+            return (
+                "I'm here to help! Try saying 'show menu' to see our products.",
+                None,
+                checkout_id,
+                checkout_touched,
+            )
 
         except Exception:
             logger.exception("Error in agent chat")
             return await self._fallback_chat(message)
 
-    async def _fallback_chat(self, message: str) -> tuple[str, list[dict] | None]:
+    async def _fallback_chat(
+        self, message: str
+    ) -> tuple[str, list[dict] | None, str | None, bool]:
         """Fallback chat when ADK is not available."""
-        msg_lower = message.lower()
-
         # Simple keyword matching for demo
-        if any(word in msg_lower for word in ["menu", "products", "browse", "show"]):
+        if _FALLBACK_MENU_RE.search(message):
             if not self._products:
                 await self.initialize()
             return (
                 "Here's our menu! Click on any item to add it to your cart.",
                 self._products,
+                None,
+                False,
             )
 
-        return (
-            """Hi! I'm your Cymbal Coffee Shop assistant. Here's what I can do:
-
-- **Show menu** - See all our drinks and food
-- **Add items** - "Add a latte to my cart"
-- **Apply discounts** - "Use code DEMO20"
-- **Select shipping** - "Pickup", "Standard", or "Express"
-- **Checkout** - Complete your order
-
-What would you like today?""",
-            None,
-        )
+        return (_FALLBACK_HELP, None, None, False)
 
     async def chat(self, message: str, session_id: str = "default") -> str:
         """Process a chat message and return a response.
@@ -999,7 +1177,7 @@ What would you like today?""",
         Returns:
             Agent's response
         """
-        response, _ = await self.chat_with_products(message, session_id)
+        response, _, _, _ = await self.chat_with_products(message, session_id)
         return response
 
     async def get_checkout_id(self, session_id: str = "default") -> str | None:
@@ -1014,17 +1192,14 @@ What would you like today?""",
         if not self._runner:
             return None
 
-        try:
-            session = await self._session_service.get_session(
-                app_name="cymbal_coffee_shop",
-                user_id="demo_user",
-                session_id=session_id,
-            )
-            if session and session.state:
-                return session.state.get(ADK_USER_CHECKOUT_ID)
-        except Exception:
-            pass
-        return None
+        session = await self._session_service.get_session(
+            app_name="cymbal_coffee_shop",
+            user_id="demo_user",
+            session_id=session_id,
+        )
+        # get_session returns None for unknown sessions; no exception to
+        # catch, so a missing session is a plain branch
+        return session.state.get(ADK_USER_CHECKOUT_ID) if session else None
 
 
 # Backwards compatibility alias
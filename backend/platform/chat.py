@@ -1,20 +1,27 @@
 """Chat API for the shopping agent."""
 
+import asyncio
 import logging
 from typing import Any
 
+from cachetools import TTLCache
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-from backend.platform.agent import ShoppingAgent, _reset_emitted_events
+from backend.platform.agent import ShoppingAgent
 from backend.visualizer.events import event_store
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["platform"])
 
-# Global agent instance (demo purposes - in production use proper session management)
-_agents: dict[str, ShoppingAgent] = {}
+# Per-session agents, bounded so a long-running process doesn't leak a
+# Runner + session service per session id. TTLCache expires entries a fixed
+# 30 minutes after insertion, so get_agent re-inserts on every hit to slide
+# the window — giving idle-based expiry. The lock guards check-then-create
+# under concurrent requests.
+_agents: TTLCache = TTLCache(maxsize=1024, ttl=1800)
+_agents_lock = asyncio.Lock()
 
 
 class ProductDisplay(BaseModel):
@@ -44,11 +51,16 @@ class ChatResponse(BaseModel):
     checkout_session: dict[str, Any] | None = None
 
 
-def get_agent(session_id: str) -> ShoppingAgent:
+async def get_agent(session_id: str) -> ShoppingAgent:
     """Get or create an agent for the session."""
-    if session_id not in _agents:
-        _agents[session_id] = ShoppingAgent()
-    return _agents[session_id]
+    async with _agents_lock:
+        agent = _agents.get(session_id)
+        if agent is None:
+            agent = ShoppingAgent()
+        # (Re-)insert to restart the TTL clock; an actively chatting user
+        # must not lose their agent mid-conversation.
+        _agents[session_id] = agent
+        return agent
 
 
 @router.post("/chat", response_model=ChatResponse)
@@ -58,11 +70,11 @@ async def chat(request: ChatRequest) -> ChatResponse:
     The agent will understand natural language requests and
     execute UCP operations to fulfill them.
     """
-    agent = get_agent(request.session_id)
+    agent = await get_agent(request.session_id)
 
     try:
-        response, products = await agent.chat_with_products(
-            request.message, request.session_id
+        response, products, checkout_id, checkout_touched = (
+            await agent.chat_with_products(request.message, request.session_id)
         )
 
         product_displays = None
@@ -70,26 +82,25 @@ async def chat(request: ChatRequest) -> ChatResponse:
 
         if products:
             show_products = True
+            # Products come from the agent's catalog dumps, already validated
+            # server-side, so construction skips Pydantic validation.
             product_displays = [
-                ProductDisplay(
+                ProductDisplay.model_construct(
                     id=p["id"],
                     title=p["title"],
                     description=p.get("description"),
-                    price=f"${p['price']/100:.2f}",
+                    price=p["price_display"],
                     image_url=p.get("image_url"),
                 )
                 for p in products
             ]
 
-        # Fetch the current checkout session if it exists
+        # Fetch the current checkout session only when this turn actually hit
+        # a checkout tool; plain conversation turns skip the fetch and dump
         checkout_session_data = None
-        checkout_id = await agent.get_checkout_id(request.session_id)
-        if checkout_id:
-            try:
-                checkout = agent.ucp_client.get_checkout(checkout_id)
-                checkout_session_data = checkout.model_dump(mode="json")
-            except Exception:
-                pass  # Checkout may have expired or been completed
+        if checkout_id and checkout_touched:
+            # Returns None if the checkout expired or was completed
+            checkout_session_data = agent.ucp_client.get_checkout_dumped(checkout_id)
 
         return ChatResponse(
             response=response,
@@ -106,11 +117,10 @@ async def chat(request: ChatRequest) -> ChatResponse:
 @router.post("/chat/reset")
 async def reset_chat(session_id: str = "default") -> dict:
     """Reset the chat session and create a new agent."""
-    if session_id in _agents:
-        del _agents[session_id]
-    # Reset the emitted events tracker so discovery events fire again
-    _reset_emitted_events()
-    # Clear the event store to prevent duplicate events in visualizer
+    async with _agents_lock:
+        _agents.pop(session_id, None)
+    # The emitted-events tracker lives in ADK session state, so dropping the
+    # agent resets it; just clear the event store to prevent duplicate events
     event_store.clear()
     return {"status": "reset", "session_id": session_id}
 
@@ -118,10 +128,10 @@ async def reset_chat(session_id: str = "default") -> dict:
 @router.get("/chat/status")
 async def chat_status(session_id: str = "default") -> dict:
     """Get the status of the chat session."""
-    if session_id not in _agents:
+    async with _agents_lock:
+        agent = _agents.get(session_id)
+    if agent is None:
         return {"status": "no_session", "session_id": session_id}
-
-    agent = _agents[session_id]
     checkout_id = await agent.get_checkout_id(session_id)
     return {
         "status": "active",
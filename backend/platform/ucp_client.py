@@ -8,13 +8,16 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from cachetools import LRUCache
+
 from backend.business.catalog import (
-    FULFILLMENT_OPTIONS,
-    get_all_products,
+    FULFILLMENT_OPTION_MODELS,
+    PRODUCTS_DUMP,
     get_product,
     validate_discount_code,
 )
 from backend.business.checkout import (
+    SessionData,
     build_checkout_response,
     checkout_sessions,
 )
@@ -24,13 +27,73 @@ from backend.schemas.checkout import (
     CheckoutStatus,
     Discount,
     Fulfillment,
-    FulfillmentOption,
     LineItem,
     OrderConfirmation,
     PostalAddress,
 )
 from backend.schemas.ucp import UCPProfile
 
+# The demo business profile is static, so build it (and the derived views the
+# agent asks for every turn) once at import time instead of per client
+# instance.
+_STATIC_PROFILE = UCPProfile(
+    ucp={
+        "version": "2026-01-11",
+        "capabilities": {
+            "dev.ucp.shopping.checkout": [
+                {
+                    "version": "2026-01-11",
+                    "spec": "https://ucp.dev/specification/checkout",
+                    "schema": "https://ucp.dev/schemas/shopping/checkout.json",
+                }
+            ],
+            "dev.ucp.shopping.fulfillment": [
+                {
+                    "version": "2026-01-11",
+                    "spec": "https://ucp.dev/specification/fulfillment",
+                    "schema": "https://ucp.dev/schemas/shopping/fulfillment.json",
+                    "extends": "dev.ucp.shopping.checkout",
+                }
+            ],
+            "dev.ucp.shopping.discount": [
+                {
+                    "version": "2026-01-11",
+                    "spec": "https://ucp.dev/specification/discount",
+                    "schema": "https://ucp.dev/schemas/shopping/discount.json",
+                    "extends": "dev.ucp.shopping.checkout",
+                }
+            ],
+        },
+        "payment_handlers": {
+            "dev.ucp.demo.mock_tokenizer": [
+                {"id": "mock_tokenizer_001", "version": "2026-01-11"}
+            ]
+        },
+        "services": {},
+    }
+)
+
+_STATIC_CAPABILITIES: list[str] = list(_STATIC_PROFILE.ucp.capabilities.keys())
+
+# Base URL for order permalinks; a constant so the f-string in
+# complete_checkout doesn't rebuild the scheme/host portion per order.
+_ORDER_PERMALINK_BASE = "http://localhost:8000/orders"
+
+# Memoized JSON-mode dumps keyed by session id; entries are
+# (updated_at, dump). Write paths bump updated_at, invalidating the entry.
+_dump_cache: LRUCache = LRUCache(maxsize=1024)
+
+_STATIC_PAYMENT_HANDLERS: list[dict] = [
+    {
+        "name": name,
+        "id": handler.id,
+        "version": handler.version,
+        "config": handler.config,
+    }
+    for name, handler_list in _STATIC_PROFILE.ucp.payment_handlers.items()
+    for handler in handler_list
+]
+
 
 class UCPClient:
     """Client for UCP operations using direct function calls.
@@ -60,45 +123,10 @@ class UCPClient:
     def discover(self) -> UCPProfile:
         """Discover business capabilities.
 
-        Returns a pre-built UCP profile since we're running in the same process.
+        Returns the pre-built static profile since we're running in the same
+        process; the model is shared read-only across all clients.
         """
-        # Build profile directly from known capabilities
-        self._profile = UCPProfile(
-            ucp={
-                "version": "2026-01-11",
-                "capabilities": {
-                    "dev.ucp.shopping.checkout": [
-                        {
-                            "version": "2026-01-11",
-                            "spec": "https://ucp.dev/specification/checkout",
-                            "schema": "https://ucp.dev/schemas/shopping/checkout.json",
-                        }
-                    ],
-                    "dev.ucp.shopping.fulfillment": [
-                        {
-                            "version": "2026-01-11",
-                            "spec": "https://ucp.dev/specification/fulfillment",
-                            "schema": "https://ucp.dev/schemas/shopping/fulfillment.json",
-                            "extends": "dev.ucp.shopping.checkout",
-                        }
-                    ],
-                    "dev.ucp.shopping.discount": [
-                        {
-                            "version": "2026-01-11",
-                            "spec": "https://ucp.dev/specification/discount",
-                            "schema": "https://ucp.dev/schemas/shopping/discount.json",
-                            "extends": "dev.ucp.shopping.checkout",
-                        }
-                    ],
-                },
-                "payment_handlers": {
-                    "dev.ucp.demo.mock_tokenizer": [
-                        {"id": "mock_tokenizer_001", "version": "2026-01-11"}
-                    ]
-                },
-                "services": {},
-            }
-        )
+        self._profile = _STATIC_PROFILE
         self._discovered = True
         return self._profile
 
@@ -113,28 +141,19 @@ class UCPClient:
     def get_capabilities(self) -> list[str]:
         if not self._profile:
             return []
-        return list(self._profile.ucp.capabilities.keys())
+        return _STATIC_CAPABILITIES
 
     def get_payment_handlers(self) -> list[dict]:
         if not self._profile:
             return []
-        handlers = []
-        for name, handler_list in self._profile.ucp.payment_handlers.items():
-            for handler in handler_list:
-                handlers.append(
-                    {
-                        "name": name,
-                        "id": handler.id,
-                        "version": handler.version,
-                        "config": handler.config,
-                    }
-                )
-        return handlers
+        return _STATIC_PAYMENT_HANDLERS
 
     def get_products(self) -> list[dict]:
-        """Get available products directly from catalog."""
-        products = get_all_products()
-        return [p.model_dump() for p in products]
+        """Get available products directly from catalog.
+
+        Returns the catalog's import-time dump; treat it as read-only.
+        """
+        return PRODUCTS_DUMP
 
     def create_checkout(
         self,
@@ -148,47 +167,12 @@ class UCPClient:
         now = datetime.now(timezone.utc)
 
         # Process line items
-        processed_items: list[LineItem] = []
-        for item in line_items:
-            product = get_product(item["product_id"])
-            if product is None:
-                raise ValueError(f"Product not found: {item['product_id']}")
+        processed_items = self._process_line_items(line_items)
 
-            qty = item.get("quantity", 1)
-            processed_items.append(
-                LineItem(
-                    id=f"li_{uuid.uuid4().hex[:8]}",
-                    product_id=product.id,
-                    title=product.title,
-                    description=product.description,
-                    image_url=product.image_url,
-                    quantity=qty,
-                    unit_price=product.price,
-                    total_price=product.price * qty,
-                    currency=product.currency,
-                )
-            )
-
-        # Process discounts
-        discounts: list[Discount] = []
-        for code in discount_codes or []:
-            discount_info = validate_discount_code(code)
-            if discount_info:
-                subtotal = sum(item.total_price for item in processed_items)
-                if discount_info["type"] == "percentage":
-                    amount = int(subtotal * discount_info["value"] / 100)
-                elif discount_info["type"] == "fixed":
-                    amount = min(discount_info["value"], subtotal)
-                else:
-                    amount = 0
-                discounts.append(
-                    Discount(
-                        code=code.upper(),
-                        title=discount_info["title"],
-                        amount=amount,
-                        currency="USD",
-                    )
-                )
+        # Process discounts; subtotal is computed once up front rather than
+        # per code, since it only depends on the line items.
+        subtotal = sum(item.total_price for item in processed_items)
+        discounts = self._process_discounts(discount_codes or [], subtotal)
 
         # Build fulfillment
         fulfillment_obj = Fulfillment(
@@ -199,31 +183,57 @@ class UCPClient:
             selected_option_id=fulfillment.get("selected_option_id")
             if fulfillment
             else None,
-            available_options=[FulfillmentOption(**opt) for opt in FULFILLMENT_OPTIONS],
+            available_options=FULFILLMENT_OPTION_MODELS,
         )
 
         # Store session
-        session_data = {
-            "id": session_id,
-            "line_items": processed_items,
-            "buyer": Buyer(**buyer) if buyer else None,
-            "fulfillment": fulfillment_obj,
-            "discounts": discounts,
-            "status": None,
-            "order": None,
-            "created_at": now,
-            "updated_at": now,
-            "expires_at": now + timedelta(hours=24),
-        }
+        session_data = SessionData(
+            id=session_id,
+            line_items=processed_items,
+            buyer=Buyer(**buyer) if buyer else None,
+            fulfillment=fulfillment_obj,
+            discounts=discounts,
+            status=None,
+            order=None,
+            created_at=now,
+            updated_at=now,
+            expires_at=now + timedelta(hours=24),
+        )
         checkout_sessions[session_id] = session_data
 
         return build_checkout_response(session_data)
 
     def get_checkout(self, session_id: str) -> CheckoutSession:
         """Get checkout session."""
-        if session_id not in checkout_sessions:
+        session_data = checkout_sessions.get(session_id)
+        if session_data is None:
             raise ValueError(f"Checkout session not found: {session_id}")
-        return build_checkout_response(checkout_sessions[session_id])
+        return build_checkout_response(session_data)
+
+    def try_get_checkout(self, session_id: str) -> CheckoutSession | None:
+        """Get a checkout session, or None if it doesn't exist.
+
+        The None-returning variant lets callers that expect missing sessions
+        (expired, completed) branch instead of catching ValueError.
+        """
+        session_data = checkout_sessions.get(session_id)
+        return build_checkout_response(session_data) if session_data else None
+
+    def get_checkout_dumped(self, session_id: str) -> dict | None:
+        """Get a checkout session as a JSON-mode dict, or None if missing.
+
+        The dump is memoized on updated_at, so repeated reads of an unchanged
+        session (one per chat turn) reuse the serialized dict.
+        """
+        checkout = self.try_get_checkout(session_id)
+        if checkout is None:
+            return None
+        cached = _dump_cache.get(session_id)
+        if cached is not None and cached[0] == checkout.updated_at:
+            return cached[1]
+        dumped = checkout.model_dump(mode="json")
+        _dump_cache[session_id] = (checkout.updated_at, dumped)
+        return dumped
 
     def update_checkout(
         self,
@@ -234,15 +244,123 @@ class UCPClient:
         discount_codes: list[str] | None = None,
     ) -> CheckoutSession:
         """Update checkout session."""
-        if session_id not in checkout_sessions:
+        session_data = checkout_sessions.get(session_id)
+        if session_data is None:
             raise ValueError(f"Checkout session not found: {session_id}")
-
-        session_data = checkout_sessions[session_id]
         now = datetime.now(timezone.utc)
 
         # Process line items
+        processed_items = self._process_line_items(line_items or [])
+
+        # Process discounts; subtotal is computed once up front rather than
+        # per code, since it only depends on the line items.
+        subtotal = sum(item.total_price for item in processed_items)
+        discounts = self._process_discounts(discount_codes or [], subtotal)
+
+        # Build fulfillment
+        fulfillment_obj = None
+        if fulfillment:
+            fulfillment_obj = Fulfillment(
+                type="shipping",
+                address=PostalAddress(**fulfillment["address"])
+                if fulfillment.get("address")
+                else None,
+                selected_option_id=fulfillment.get("selected_option_id"),
+                available_options=FULFILLMENT_OPTION_MODELS,
+            )
+
+        # Update session
+        session_data.line_items = processed_items
+        session_data.buyer = Buyer(**buyer) if buyer else None
+        session_data.fulfillment = fulfillment_obj
+        session_data.discounts = discounts
+        session_data.updated_at = now
+
+        return build_checkout_response(session_data)
+
+    def patch_checkout(
+        self,
+        session_id: str,
+        *,
+        fulfillment: dict[str, Any] | None = None,
+        add_discount_codes: list[str] | None = None,
+        add_line_items: list[dict[str, Any]] | None = None,
+    ) -> CheckoutSession:
+        """Apply a partial update to a checkout session.
+
+        Unlike update_checkout's full-replacement semantics, only the
+        provided delta fields change; everything else is preserved from the
+        stored session. This lets callers mutate one field without first
+        reading back the full checkout state.
+
+        Args:
+            session_id: The checkout session to patch
+            fulfillment: Fulfillment delta; missing keys keep current values
+            add_discount_codes: Codes to add (duplicates are ignored)
+            add_line_items: Items to merge into the cart by quantity
+        """
+        session_data = checkout_sessions.get(session_id)
+        if session_data is None:
+            raise ValueError(f"Checkout session not found: {session_id}")
+        now = datetime.now(timezone.utc)
+
+        if add_line_items:
+            # Merge quantities into the existing cart
+            existing_items: list[LineItem] = session_data.line_items
+            item_map = {li.product_id: li.quantity for li in existing_items}
+            for item in add_line_items:
+                product_id = item["product_id"]
+                item_map[product_id] = item_map.get(product_id, 0) + item.get(
+                    "quantity", 1
+                )
+            session_data.line_items = self._process_line_items(
+                [{"product_id": pid, "quantity": qty} for pid, qty in item_map.items()]
+            )
+
+        if fulfillment is not None:
+            current: Fulfillment | None = session_data.fulfillment
+            address = (
+                PostalAddress(**fulfillment["address"])
+                if fulfillment.get("address")
+                else (current.address if current else None)
+            )
+            selected_option_id = fulfillment.get(
+                "selected_option_id",
+                current.selected_option_id if current else None,
+            )
+            session_data.fulfillment = Fulfillment(
+                type="shipping",
+                address=address,
+                selected_option_id=selected_option_id,
+                available_options=FULFILLMENT_OPTION_MODELS,
+            )
+
+        # Recompute discounts: amounts depend on the (possibly changed)
+        # subtotal, and new codes extend the stored ones (stored uppercase).
+        codes = [d.code for d in session_data.discounts]
+        for code in add_discount_codes or []:
+            code = code.strip().upper()
+            if code not in codes:
+                codes.append(code)
+        if codes:
+            subtotal = sum(li.total_price for li in session_data.line_items)
+            session_data.discounts = self._process_discounts(codes, subtotal)
+
+        session_data.updated_at = now
+
+        return build_checkout_response(session_data)
+
+    def _process_line_items(
+        self, line_items: list[dict[str, Any]]
+    ) -> list[LineItem]:
+        """Resolve line-item dicts against the catalog into LineItem models.
+
+        One RNG draw seeds every line-item ID (same scheme as the business
+        handlers); a per-item uuid4() would hit the entropy pool per item.
+        """
+        item_id_seed = uuid.uuid4().hex[:6]
         processed_items: list[LineItem] = []
-        for item in line_items or []:
+        for i, item in enumerate(line_items):
             product = get_product(item["product_id"])
             if product is None:
                 raise ValueError(f"Product not found: {item['product_id']}")
@@ -250,24 +368,29 @@ class UCPClient:
             qty = item.get("quantity", 1)
             processed_items.append(
                 LineItem(
-                    id=f"li_{uuid.uuid4().hex[:8]}",
+                    id=f"li_{item_id_seed}{i:02x}",
                     product_id=product.id,
                     title=product.title,
                     description=product.description,
                     image_url=product.image_url,
                     quantity=qty,
                     unit_price=product.price,
-                    total_price=product.price * qty,
                     currency=product.currency,
                 )
             )
+        return processed_items
 
-        # Process discounts
+    def _process_discounts(
+        self, discount_codes: list[str], subtotal: int
+    ) -> list[Discount]:
+        """Validate discount codes and build Discount models."""
         discounts: list[Discount] = []
-        for code in discount_codes or []:
+        for code in discount_codes:
+            # Normalize here rather than relying on Discount's validator, so
+            # the stored-uppercase invariant holds however codes arrive
+            code = code.strip().upper()
             discount_info = validate_discount_code(code)
             if discount_info:
-                subtotal = sum(item.total_price for item in processed_items)
                 if discount_info["type"] == "percentage":
                     amount = int(subtotal * discount_info["value"] / 100)
                 elif discount_info["type"] == "fixed":
@@ -276,39 +399,13 @@ class UCPClient:
                     amount = 0
                 discounts.append(
                     Discount(
-                        code=code.upper(),
+                        code=code,
                         title=discount_info["title"],
                         amount=amount,
                         currency="USD",
                     )
                 )
-
-        # Build fulfillment
-        fulfillment_obj = None
-        if fulfillment:
-            fulfillment_obj = Fulfillment(
-                type="shipping",
-                address=PostalAddress(**fulfillment["address"])
-                if fulfillment.get("address")
-                else None,
-                selected_option_id=fulfillment.get("selected_option_id"),
-                available_options=[
-                    FulfillmentOption(**opt) for opt in FULFILLMENT_OPTIONS
-                ],
-            )
-
-        # Update session
-        session_data.update(
-            {
-                "line_items": processed_items,
-                "buyer": Buyer(**buyer) if buyer else None,
-                "fulfillment": fulfillment_obj,
-                "discounts": discounts,
-                "updated_at": now,
-            }
-        )
-
-        return build_checkout_response(session_data)
+        return discounts
 
     def complete_checkout(
         self,
@@ -317,44 +414,35 @@ class UCPClient:
         risk_signals: dict[str, Any] | None = None,
     ) -> CheckoutSession:
         """Complete checkout and create order."""
-        if session_id not in checkout_sessions:
+        session_data = checkout_sessions.get(session_id)
+        if session_data is None:
             raise ValueError(f"Checkout session not found: {session_id}")
-
-        session_data = checkout_sessions[session_id]
         now = datetime.now(timezone.utc)
 
-        # Create order
+        # Create order (single uuid draw; the permalink must reference the same id)
+        order_id = f"ord_{uuid.uuid4().hex[:12]}"
         order = OrderConfirmation(
-            id=f"ord_{uuid.uuid4().hex[:12]}",
-            permalink_url=f"http://localhost:8000/orders/ord_{uuid.uuid4().hex[:12]}",
+            id=order_id,
+            permalink_url=f"{_ORDER_PERMALINK_BASE}/{order_id}",
             created_at=now,
         )
 
         # Update session
-        session_data.update(
-            {
-                "status": CheckoutStatus.COMPLETED,
-                "order": order,
-                "updated_at": now,
-            }
-        )
+        session_data.status = CheckoutStatus.COMPLETED
+        session_data.order = order
+        session_data.updated_at = now
 
         return build_checkout_response(session_data)
 
     def cancel_checkout(self, session_id: str) -> CheckoutSession:
         """Cancel checkout session."""
-        if session_id not in checkout_sessions:
+        session_data = checkout_sessions.get(session_id)
+        if session_data is None:
             raise ValueError(f"Checkout session not found: {session_id}")
-
-        session_data = checkout_sessions[session_id]
         now = datetime.now(timezone.utc)
 
-        session_data.update(
-            {
-                "status": CheckoutStatus.CANCELED,
-                "updated_at": now,
-            }
-        )
+        session_data.status = CheckoutStatus.CANCELED
+        session_data.updated_at = now
 
         return build_checkout_response(session_data)
 
@@ -2,9 +2,15 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    Field,
+    StringConstraints,
+    computed_field,
+    field_validator,
+)
 
 from backend.schemas.ucp import UCPResponseMetadata
 
@@ -36,6 +42,29 @@ class MessageSeverity(str, Enum):
     REQUIRES_BUYER_REVIEW = "requires_buyer_review"
 
 
+# ISO 4217 alpha code shared by every money-bearing model; one annotated
+# type means pydantic-core shares the constrained-str validator instead of
+# storing per-field metadata five times over.
+CurrencyCode = Annotated[str, StringConstraints(min_length=3, max_length=3)]
+
+# Literal mirrors of the enums above, used for field annotations:
+# pydantic-core validates a Literal with a direct string-set check instead
+# of constructing an Enum member, and serialization becomes a no-op. The
+# enum classes stay as the Python-side constants (str equality still holds).
+CheckoutStatusValue = Literal[
+    "incomplete",
+    "requires_escalation",
+    "ready_for_complete",
+    "complete_in_progress",
+    "completed",
+    "canceled",
+]
+MessageTypeValue = Literal["error", "warning", "info"]
+MessageSeverityValue = Literal[
+    "recoverable", "requires_buyer_input", "requires_buyer_review"
+]
+
+
 class PostalAddress(BaseModel):
     """Postal address for shipping/billing."""
 
@@ -49,8 +78,6 @@ class PostalAddress(BaseModel):
     address_country: str | None = Field(
         default=None, description="Country code (ISO 3166-1 alpha-2)"
     )
-    first_name: str | None = Field(default=None, description="First name")
-    last_name: str | None = Field(default=None, description="Last name")
 
 
 class Buyer(BaseModel):
@@ -66,14 +93,19 @@ class Buyer(BaseModel):
 
 
 class Item(BaseModel):
-    """Product item in the catalog."""
+    """Product item in the catalog.
+
+    Frozen: catalog items are shared across requests and must not mutate.
+    """
+
+    model_config = {"frozen": True}
 
     id: str = Field(description="Product identifier")
     title: str = Field(description="Product title")
     description: str | None = Field(default=None, description="Product description")
     image_url: str | None = Field(default=None, description="Product image URL")
     price: int = Field(description="Price in minor units (cents)")
-    currency: str = Field(default="USD", description="Currency code")
+    currency: CurrencyCode = Field(default="USD", description="Currency code")
 
 
 class LineItemRequest(BaseModel):
@@ -84,7 +116,12 @@ class LineItemRequest(BaseModel):
 
 
 class LineItem(BaseModel):
-    """Line item in checkout response."""
+    """Line item in checkout response.
+
+    Frozen: response models are built once and shared via response caches.
+    """
+
+    model_config = {"frozen": True}
 
     id: str = Field(description="Line item ID")
     product_id: str = Field(description="Product identifier")
@@ -93,18 +130,28 @@ class LineItem(BaseModel):
     image_url: str | None = Field(default=None, description="Product image URL")
     quantity: int = Field(ge=1, description="Quantity")
     unit_price: int = Field(description="Unit price in minor units")
-    total_price: int = Field(description="Total price (unit_price * quantity)")
-    currency: str = Field(default="USD", description="Currency code")
+    currency: CurrencyCode = Field(default="USD", description="Currency code")
+
+    @computed_field(description="Total price (unit_price * quantity)")
+    @property
+    def total_price(self) -> int:
+        """Derive the line total so it can never drift from its inputs."""
+        return self.unit_price * self.quantity
 
 
 class FulfillmentOption(BaseModel):
-    """Shipping/fulfillment option."""
+    """Shipping/fulfillment option.
+
+    Frozen: the catalog's option models are shared across every checkout.
+    """
+
+    model_config = {"frozen": True}
 
     id: str = Field(description="Option identifier")
     title: str = Field(description="Option title (e.g., 'Standard Shipping')")
     description: str | None = Field(default=None, description="Option description")
     price: int = Field(description="Shipping price in minor units")
-    currency: str = Field(default="USD", description="Currency code")
+    currency: CurrencyCode = Field(default="USD", description="Currency code")
     estimated_delivery: str | None = Field(
         default=None, description="Estimated delivery timeframe"
     )
@@ -118,44 +165,79 @@ class Fulfillment(BaseModel):
     selected_option_id: str | None = Field(
         default=None, description="Selected fulfillment option ID"
     )
-    available_options: list[FulfillmentOption] = Field(
-        default_factory=list, description="Available fulfillment options"
+    available_options: tuple[FulfillmentOption, ...] = Field(
+        default_factory=tuple, description="Available fulfillment options"
     )
 
 
 class Discount(BaseModel):
-    """Applied discount."""
+    """Applied discount.
+
+    Frozen: built once per mutation and reused from the response cache.
+    """
+
+    model_config = {"frozen": True}
 
     code: str = Field(description="Discount code")
     title: str = Field(description="Discount title")
     amount: int = Field(description="Discount amount in minor units")
-    currency: str = Field(default="USD", description="Currency code")
+    currency: CurrencyCode = Field(default="USD", description="Currency code")
+
+    @field_validator("code")
+    @classmethod
+    def _normalize_code(cls, v: str) -> str:
+        """Codes are stored stripped and uppercase so comparisons are exact."""
+        return v.strip().upper()
 
 
 class Total(BaseModel):
-    """Checkout totals."""
+    """Checkout totals.
+
+    Frozen: computed from session state, never adjusted in place.
+    """
+
+    model_config = {"frozen": True}
 
     subtotal: int = Field(description="Subtotal before discounts and shipping")
     discount: int = Field(default=0, description="Total discount amount")
     shipping: int = Field(default=0, description="Shipping cost")
     tax: int = Field(default=0, description="Tax amount")
-    total: int = Field(description="Final total")
-    currency: str = Field(default="USD", description="Currency code")
+    currency: CurrencyCode = Field(default="USD", description="Currency code")
+
+    @computed_field(description="Final total")
+    @property
+    def total(self) -> int:
+        """Derive the final total from its components.
+
+        Clamped at zero: stacked discounts can exceed the rest of the
+        charge, and the demo should never quote a negative total.
+        """
+        return max(0, self.subtotal - self.discount + self.shipping + self.tax)
 
 
 class Message(BaseModel):
-    """Message in checkout response (error, warning, info)."""
+    """Message in checkout response (error, warning, info).
 
-    type: MessageType = Field(description="Message type")
+    Frozen so canonical message instances can be shared across responses.
+    """
+
+    model_config = {"frozen": True}
+
+    type: MessageTypeValue = Field(description="Message type")
     code: str = Field(description="Message code for programmatic handling")
     content: str = Field(description="Human-readable message")
-    severity: MessageSeverity | None = Field(
+    severity: MessageSeverityValue | None = Field(
         default=None, description="Severity (for errors)"
     )
 
 
 class Link(BaseModel):
-    """Link to business policies or resources."""
+    """Link to business policies or resources.
+
+    Frozen: the static policy links are shared by every response.
+    """
+
+    model_config = {"frozen": True}
 
     type: str = Field(description="Link type (e.g., 'privacy_policy')")
     href: str = Field(description="Link URL")
@@ -163,7 +245,13 @@ class Link(BaseModel):
 
 
 class OrderConfirmation(BaseModel):
-    """Order confirmation details after checkout completion."""
+    """Order confirmation details after checkout completion.
+
+    Frozen: an order confirmation never changes after it is issued.
+    Schema build is deferred; most sessions never reach completion.
+    """
+
+    model_config = {"frozen": True, "defer_build": True}
 
     id: str = Field(description="Order ID")
     permalink_url: str | None = Field(default=None, description="Order status page URL")
@@ -211,26 +299,33 @@ class CompleteCheckoutRequest(BaseModel):
 
 
 class CheckoutSession(BaseModel):
-    """Full checkout session response."""
+    """Full checkout session response.
+
+    Container fields are tuples: the response is immutable once built and
+    cached, and a fixed-size tuple validates and stores cheaper than a
+    mutable list.
+    """
 
     ucp: UCPResponseMetadata = Field(description="UCP metadata")
     id: str = Field(description="Checkout session ID")
-    status: CheckoutStatus = Field(description="Current checkout status")
-    line_items: list[LineItem] = Field(
-        default_factory=list, description="Items in checkout"
+    status: CheckoutStatusValue = Field(description="Current checkout status")
+    line_items: tuple[LineItem, ...] = Field(
+        default_factory=tuple, description="Items in checkout"
     )
     buyer: Buyer | None = Field(default=None, description="Buyer information")
     fulfillment: Fulfillment | None = Field(
         default=None, description="Fulfillment details"
     )
-    discounts: list[Discount] = Field(
-        default_factory=list, description="Applied discounts"
+    discounts: tuple[Discount, ...] = Field(
+        default_factory=tuple, description="Applied discounts"
     )
     totals: Total | None = Field(default=None, description="Checkout totals")
-    messages: list[Message] = Field(
-        default_factory=list, description="Messages (errors, warnings, info)"
+    messages: tuple[Message, ...] = Field(
+        default_factory=tuple, description="Messages (errors, warnings, info)"
+    )
+    links: tuple[Link, ...] = Field(
+        default_factory=tuple, description="Business policy links"
     )
-    links: list[Link] = Field(default_factory=list, description="Business policy links")
     continue_url: str | None = Field(default=None, description="URL for buyer handoff")
     expires_at: datetime | None = Field(
         default=None, description="Session expiration timestamp"
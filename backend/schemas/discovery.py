@@ -1,5 +1,6 @@
 """Discovery schemas for UCP profiles."""
 
+from functools import lru_cache
 
 from backend.schemas.ucp import (
     SigningKey,
@@ -37,6 +38,10 @@ def create_demo_business_profile(
 ) -> BusinessProfile:
     """Create a demo business profile for the mock merchant.
 
+    The profile tree (~10 nested model validations) is memoized per
+    (business_url, business_name); callers get a shallow copy so the
+    cached instance can't be mutated through the return value.
+
     Args:
         business_url: Base URL of the business server
         business_name: Display name of the business
@@ -44,6 +49,15 @@ def create_demo_business_profile(
     Returns:
         BusinessProfile configured for the demo
     """
+    return _build_demo_business_profile(business_url, business_name).model_copy()
+
+
+@lru_cache(maxsize=32)
+def _build_demo_business_profile(
+    business_url: str,
+    business_name: str,
+) -> BusinessProfile:
+    """Build and cache the profile tree for one configuration."""
     return BusinessProfile(
         ucp=UCPMetadata(
             version="2026-01-11",
@@ -1,10 +1,12 @@
 """Payment schemas for UCP checkout."""
 
 from enum import Enum
-from typing import Any
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
+from backend.schemas.checkout import PostalAddress
+
 
 class PaymentInstrumentType(str, Enum):
     """Types of payment instruments."""
@@ -22,16 +24,26 @@ class PaymentCredentialType(str, Enum):
     TOKEN = "TOKEN"
 
 
+# Literal mirrors for field annotations; see the checkout schemas for the
+# rationale (string-set validation beats Enum construction per instance).
+PaymentInstrumentTypeValue = Literal["card", "bank_account", "digital_wallet"]
+PaymentCredentialTypeValue = Literal["PAYMENT_GATEWAY", "DIRECT", "TOKEN"]
+
+
 class PaymentCredential(BaseModel):
     """Payment credential returned by payment handler."""
 
-    type: PaymentCredentialType = Field(description="Credential type")
+    model_config = {"defer_build": True}
+
+    type: PaymentCredentialTypeValue = Field(description="Credential type")
     token: str = Field(description="Payment token or encrypted data")
 
 
 class PaymentDisplay(BaseModel):
     """Display information for payment instrument."""
 
+    model_config = {"defer_build": True}
+
     brand: str | None = Field(default=None, description="Card brand (visa, mastercard)")
     last_digits: str | None = Field(default=None, description="Last 4 digits")
 
@@ -39,14 +51,16 @@ class PaymentDisplay(BaseModel):
 class PaymentInstrument(BaseModel):
     """Payment instrument for checkout completion."""
 
+    model_config = {"defer_build": True}
+
     id: str = Field(description="Instrument ID")
     handler_id: str = Field(description="Payment handler ID that processed this")
-    type: PaymentInstrumentType = Field(description="Instrument type")
+    type: PaymentInstrumentTypeValue = Field(description="Instrument type")
     selected: bool = Field(default=True, description="Whether this is selected")
     display: PaymentDisplay | None = Field(
         default=None, description="Display information"
     )
-    billing_address: dict[str, Any] | None = Field(
+    billing_address: PostalAddress | None = Field(
         default=None, description="Billing address"
     )
     credential: PaymentCredential = Field(description="Payment credential")
@@ -55,6 +69,8 @@ class PaymentInstrument(BaseModel):
 class Payment(BaseModel):
     """Payment information in complete checkout request."""
 
-    instruments: list[PaymentInstrument] = Field(
-        default_factory=list, description="Payment instruments"
+    model_config = {"defer_build": True}
+
+    instruments: tuple[PaymentInstrument, ...] = Field(
+        default_factory=tuple, description="Payment instruments"
     )
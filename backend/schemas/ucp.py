@@ -1,9 +1,32 @@
 """Core UCP schema types based on the official UCP specification."""
 
 from enum import Enum
-from typing import Any
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
+
+
+def _validate_ucp_version(v: str) -> str:
+    """Check the YYYY-MM-DD shape with plain index/isdigit tests.
+
+    The structure is fixed (10 chars, dashes at 4 and 7), so explicit
+    character checks beat dispatching the equivalent regex for every
+    version field on every validated model.
+    """
+    if (
+        len(v) == 10
+        and v[4] == "-"
+        and v[7] == "-"
+        and v[:4].isdigit()
+        and v[5:7].isdigit()
+        and v[8:].isdigit()
+    ):
+        return v
+    raise ValueError("version must be in YYYY-MM-DD format")
+
+
+# Version string in YYYY-MM-DD format, shared by every versioned UCP model.
+UCPVersionStr = Annotated[str, AfterValidator(_validate_ucp_version)]
 
 
 class UCPVersion(str):
@@ -23,16 +46,20 @@ class TransportType(str, Enum):
     EMBEDDED = "embedded"
 
 
+# Literal mirror used for field annotations; validated as a plain string-set
+# membership check in pydantic-core (the enum stays for Python-side constants).
+TransportTypeValue = Literal["rest", "mcp", "a2a", "embedded"]
+
+
 class UCPService(BaseModel):
     """Service definition for UCP profile."""
 
-    version: str = Field(
+    version: UCPVersionStr = Field(
         default="2026-01-11",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
         description="Service version in YYYY-MM-DD format",
     )
     spec: str = Field(description="URL to service documentation")
-    transport: TransportType = Field(description="Transport protocol")
+    transport: TransportTypeValue = Field(description="Transport protocol")
     endpoint: str | None = Field(
         default=None, description="Business's endpoint for this transport"
     )
@@ -48,9 +75,8 @@ class UCPService(BaseModel):
 class UCPCapability(BaseModel):
     """Capability definition for UCP profile."""
 
-    version: str = Field(
+    version: UCPVersionStr = Field(
         default="2026-01-11",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
         description="Capability version in YYYY-MM-DD format",
     )
     spec: str = Field(description="URL to capability specification")
@@ -72,9 +98,8 @@ class UCPPaymentHandler(BaseModel):
     """Payment handler definition for UCP profile."""
 
     id: str = Field(description="Unique identifier for this handler instance")
-    version: str = Field(
+    version: UCPVersionStr = Field(
         default="2026-01-11",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
         description="Handler version",
     )
     spec: str | None = Field(default=None, description="URL to handler specification")
@@ -89,7 +114,13 @@ class UCPPaymentHandler(BaseModel):
 
 
 class SigningKey(BaseModel):
-    """JWK signing key for authentication."""
+    """JWK signing key for authentication.
+
+    Frozen: keys are published material; sharing the cached instance is safe.
+    Schema build is deferred until the first discovery request needs it.
+    """
+
+    model_config = {"frozen": True, "defer_build": True}
 
     kid: str = Field(description="Key ID")
     kty: str = Field(description="Key type (e.g., EC)")
@@ -101,22 +132,26 @@ class SigningKey(BaseModel):
 
 
 class UCPMetadata(BaseModel):
-    """UCP metadata block for profiles and responses."""
+    """UCP metadata block for profiles and responses.
+
+    Frozen: metadata blocks are shared by reference across cached profiles.
+    """
 
-    version: str = Field(
+    model_config = {"frozen": True}
+
+    version: UCPVersionStr = Field(
         default="2026-01-11",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
         description="UCP version",
     )
-    services: dict[str, list[UCPService]] = Field(
+    services: dict[str, tuple[UCPService, ...]] = Field(
         default_factory=dict,
         description="Service registry keyed by reverse-domain name",
     )
-    capabilities: dict[str, list[UCPCapability]] = Field(
+    capabilities: dict[str, tuple[UCPCapability, ...]] = Field(
         default_factory=dict,
         description="Capability registry keyed by reverse-domain name",
     )
-    payment_handlers: dict[str, list[UCPPaymentHandler]] = Field(
+    payment_handlers: dict[str, tuple[UCPPaymentHandler, ...]] = Field(
         default_factory=dict,
         description="Payment handler registry keyed by reverse-domain name",
     )
@@ -126,24 +161,28 @@ class UCPProfile(BaseModel):
     """Full UCP profile published by businesses and platforms."""
 
     ucp: UCPMetadata = Field(description="UCP metadata block")
-    signing_keys: list[SigningKey] | None = Field(
+    signing_keys: tuple[SigningKey, ...] | None = Field(
         default=None, description="Public keys for signature verification"
     )
 
 
 class UCPResponseMetadata(BaseModel):
-    """UCP metadata included in API responses."""
+    """UCP metadata included in API responses.
+
+    Frozen: one canonical instance is aliased into every checkout response.
+    """
+
+    model_config = {"frozen": True}
 
-    version: str = Field(
+    version: UCPVersionStr = Field(
         default="2026-01-11",
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
         description="UCP version used to process request",
     )
-    capabilities: dict[str, list[dict[str, str]]] = Field(
+    capabilities: dict[str, tuple[dict[str, str], ...]] = Field(
         default_factory=dict,
         description="Active capabilities for this response",
     )
-    payment_handlers: dict[str, list[dict[str, str]]] = Field(
+    payment_handlers: dict[str, tuple[dict[str, str], ...]] = Field(
         default_factory=dict,
         description="Active payment handlers for this response",
     )
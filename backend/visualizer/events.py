@@ -1,11 +1,16 @@
 """Protocol event capture and formatting."""
 
-import json
-from dataclasses import asdict, dataclass, field
-from datetime import datetime, timezone
+import os
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
 from enum import Enum
+from itertools import islice
 from typing import Any
 
+import orjson
+
 
 class EventType(str, Enum):
     """Types of UCP protocol events."""
@@ -325,14 +330,18 @@ class EventDirection(str, Enum):
     RESPONSE = "response"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProtocolEvent:
-    """A captured UCP protocol event."""
+    """A captured UCP protocol event.
+
+    Slotted: the store holds up to max_events of these plus a transient one
+    per capture call, and slots skip the per-instance ``__dict__``.
+    """
 
     id: str
     type: EventType
     direction: EventDirection
-    timestamp: str
+    timestamp: float
     method: str
     path: str
     headers: dict[str, str] = field(default_factory=dict)
@@ -341,38 +350,85 @@ class ProtocolEvent:
     duration_ms: float | None = None
 
     def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary.
+
+        Built by hand rather than ``dataclasses.asdict``, which recursively
+        deep-copies every field on each call. The enum fields are str-Enums,
+        so their ``.value`` keeps the dict plain strings.
+        """
+        return {
+            "id": self.id,
+            "type": self.type.value,
+            "direction": self.direction.value,
+            "timestamp": self.timestamp,
+            "method": self.method,
+            "path": self.path,
+            "headers": self.headers,
+            "body": self.body,
+            "status_code": self.status_code,
+            "duration_ms": self.duration_ms,
+        }
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), default=str)
+        return orjson.dumps(self.to_dict(), default=str).decode()
+
+
+# Formatted payloads and serialized "event" frames, keyed by event id.
+# Events are immutable once stored, so each one is formatted and serialized
+# at most once no matter how many clients subscribe or reconnect. Populated
+# lazily on first use; EventStore evicts entries as events leave the ring.
+_display_cache: dict[str, dict] = {}
+_frame_cache: dict[str, bytes] = {}
 
 
 class EventStore:
     """In-memory store for protocol events."""
 
-    def __init__(self, max_events: int = 100):
+    def __init__(
+        self,
+        max_events: int = 100,
+        sample_rates: dict[EventType, int] | None = None,
+    ):
         """Initialize the event store.
 
         Args:
             max_events: Maximum number of events to keep
+            sample_rates: Optional 1-in-N sampling per event type; types not
+                listed (or with a rate of 1) are always kept
         """
         self.max_events = max_events
-        self._events: list[ProtocolEvent] = []
-        self._subscribers: list = []
+        self._events: deque[ProtocolEvent] = deque(maxlen=max_events)
+        # Weak references: a callback whose module is reloaded (or otherwise
+        # dropped) disappears on its own instead of leaking across reloads
+        self._subscribers: weakref.WeakSet = weakref.WeakSet()
         self._event_counter = 0
+        self._sample_rates = {
+            t: rate for t, rate in (sample_rates or {}).items() if rate > 1
+        }
+        self._sample_counters: dict[EventType, int] = {}
 
     def add_event(self, event: ProtocolEvent) -> None:
         """Add an event to the store."""
+        # Sampled types keep the first of every N events; agent inner loops
+        # can emit these faster than the visualizer needs them.
+        rate = self._sample_rates.get(event.type)
+        if rate:
+            count = self._sample_counters.get(event.type, 0)
+            self._sample_counters[event.type] = count + 1
+            if count % rate:
+                return
+
+        # The bounded deque evicts the oldest event on append; drop its
+        # cached payloads first so the caches track the ring exactly.
+        if len(self._events) == self.max_events:
+            dropped = self._events[0]
+            _display_cache.pop(dropped.id, None)
+            _frame_cache.pop(dropped.id, None)
         self._events.append(event)
 
-        # Trim if over max
-        if len(self._events) > self.max_events:
-            self._events = self._events[-self.max_events :]
-
-        # Notify subscribers
-        for subscriber in self._subscribers:
+        # Notify subscribers (snapshot: the WeakSet can shrink mid-loop)
+        for subscriber in tuple(self._subscribers):
             try:
                 subscriber(event)
             except Exception:
@@ -380,24 +436,23 @@ class EventStore:
 
     def get_events(self, limit: int = 50) -> list[ProtocolEvent]:
         """Get recent events."""
-        return self._events[-limit:]
+        if limit >= len(self._events):
+            return list(self._events)
+        return list(islice(self._events, len(self._events) - limit, None))
 
     def clear(self) -> None:
         """Clear all events."""
-        self._events = []
+        self._events.clear()
+        _display_cache.clear()
+        _frame_cache.clear()
 
     def subscribe(self, callback) -> None:
-        """Subscribe to new events.
-
-        Prevents duplicate subscriptions (important for hot-reload).
-        """
-        if callback not in self._subscribers:
-            self._subscribers.append(callback)
+        """Subscribe to new events (set semantics, so re-adds are no-ops)."""
+        self._subscribers.add(callback)
 
     def unsubscribe(self, callback) -> None:
         """Unsubscribe from events."""
-        if callback in self._subscribers:
-            self._subscribers.remove(callback)
+        self._subscribers.discard(callback)
 
     def next_id(self) -> str:
         """Generate next event ID."""
@@ -405,8 +460,14 @@ class EventStore:
         return f"evt_{self._event_counter:06d}"
 
 
-# Global event store
-event_store = EventStore()
+# Global event store. Agent thinking events are the chattiest type; set
+# UCP_EVENT_SAMPLE_AGENT_THINKING=N to keep 1-in-N of them under load.
+_THINKING_RATE = int(os.getenv("UCP_EVENT_SAMPLE_AGENT_THINKING", "1"))
+event_store = EventStore(
+    sample_rates=(
+        {EventType.AGENT_THINKING: _THINKING_RATE} if _THINKING_RATE > 1 else None
+    )
+)
 
 
 def capture_request(
@@ -415,13 +476,18 @@ def capture_request(
     path: str,
     headers: dict[str, str] | None = None,
     body: dict[str, Any] | None = None,
+    event_id: str | None = None,
 ) -> str:
-    """Capture a request event and return its ID."""
+    """Capture a request event and return its ID.
+
+    Callers that defer capture to a background task can pre-allocate the ID
+    with ``event_store.next_id()`` and pass it as ``event_id``.
+    """
     event = ProtocolEvent(
-        id=event_store.next_id(),
+        id=event_id or event_store.next_id(),
         type=event_type,
         direction=EventDirection.REQUEST,
-        timestamp=datetime.now(timezone.utc).isoformat(),
+        timestamp=time.time(),
         method=method,
         path=path,
         headers=headers or {},
@@ -445,7 +511,7 @@ def capture_response(
         id=f"{request_id}_resp",
         type=event_type,
         direction=EventDirection.RESPONSE,
-        timestamp=datetime.now(timezone.utc).isoformat(),
+        timestamp=time.time(),
         method=method,
         path=path,
         status_code=status_code,
@@ -456,9 +522,12 @@ def capture_response(
 
 
 def format_event_for_display(event: ProtocolEvent) -> dict:
-    """Format an event for display in the visualizer."""
-    event_info = UCP_EVENT_INFO.get(event.type.value, {})
+    """Format an event for display in the visualizer.
 
+    Educational text (title, description, details, ...) is deliberately not
+    embedded here: it's constant per event type and served once via
+    /api/v1/event-info, where the client joins it by ``type``.
+    """
     return {
         "id": event.id,
         "type": event.type.value,
@@ -468,24 +537,32 @@ def format_event_for_display(event: ProtocolEvent) -> dict:
         "path": event.path,
         "status_code": event.status_code,
         "duration_ms": event.duration_ms,
-        "body_preview": json.dumps(event.body) if event.body else None,
+        "body_preview": orjson.dumps(event.body).decode() if event.body else None,
         "has_ucp": _has_ucp_metadata(event.body) if event.body else False,
-        # Educational context - short description for event list
-        "title": event_info.get("title", event.type.value),
-        "description": event_info.get("description", ""),
-        # Detailed commentary for inspector panel
-        "details": event_info.get("details", ""),
-        "ucp_concept": event_info.get("ucp_concept", ""),
-        "learn_more": event_info.get("learn_more", ""),
     }
 
 
-def _get_body_preview(body: dict, max_length: int = 100) -> str:
-    """Get a preview of the body."""
-    text = json.dumps(body)
-    if len(text) > max_length:
-        return text[: max_length - 3] + "..."
-    return text
+def display_payload(event: ProtocolEvent) -> dict:
+    """Return the formatted display dict for an event, memoized by id."""
+    payload = _display_cache.get(event.id)
+    if payload is None:
+        payload = _display_cache[event.id] = format_event_for_display(event)
+    return payload
+
+
+def event_frame(event: ProtocolEvent) -> bytes:
+    """Return the serialized ``{"type": "event", ...}`` frame, memoized by id.
+
+    Broadcast and initial-replay both send this exact frame, so the
+    format + serialize cost is paid once per event rather than once
+    per subscriber.
+    """
+    frame = _frame_cache.get(event.id)
+    if frame is None:
+        frame = _frame_cache[event.id] = orjson.dumps(
+            {"type": "event", "data": display_payload(event)}
+        )
+    return frame
 
 
 def _has_ucp_metadata(body: dict) -> bool:
@@ -500,7 +577,7 @@ def capture_agent_thinking(message: str, session_id: str = "default") -> str:
         id=event_store.next_id(),
         type=EventType.AGENT_THINKING,
         direction=EventDirection.REQUEST,
-        timestamp=datetime.now(timezone.utc).isoformat(),
+        timestamp=time.time(),
         method="THINK",
         path=f"/agent/{session_id}",
         body={"message": message},
@@ -519,7 +596,7 @@ def capture_agent_tool_call(
         id=event_store.next_id(),
         type=EventType.AGENT_TOOL_CALL,
         direction=EventDirection.REQUEST,
-        timestamp=datetime.now(timezone.utc).isoformat(),
+        timestamp=time.time(),
         method="CALL",
         path=f"/agent/tools/{tool_name}",
         body={"tool": tool_name, "args": args},
@@ -539,7 +616,7 @@ def capture_agent_tool_result(
         id=f"{tool_call_id}_result",
         type=EventType.AGENT_TOOL_RESULT,
         direction=EventDirection.RESPONSE,
-        timestamp=datetime.now(timezone.utc).isoformat(),
+        timestamp=time.time(),
         method="RESULT",
         path=f"/agent/tools/{tool_name}",
         status_code=200 if success else 500,
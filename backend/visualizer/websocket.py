@@ -1,55 +1,149 @@
 """WebSocket server for real-time protocol visualization."""
 
 import asyncio
-import json
+import logging
 from typing import Set
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi.responses import Response
 
 from backend.visualizer.events import (
+    UCP_EVENT_INFO,
     ProtocolEvent,
+    display_payload,
+    event_frame,
     event_store,
-    format_event_for_display,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(tags=["visualizer"])
 
 # Connected WebSocket clients
 connected_clients: Set[WebSocket] = set()
 
+# Constant frames, serialized once; pong and keepalive in particular go out
+# on every idle tick of every connection.
+_CONNECTED_FRAME = orjson.dumps(
+    {"type": "connected", "message": "Connected to UCP event stream"}
+)
+_PONG_FRAME = orjson.dumps({"type": "pong"})
+_CLEARED_FRAME = orjson.dumps({"type": "cleared", "message": "Event store cleared"})
+_KEEPALIVE_FRAME = orjson.dumps({"type": "keepalive"})
 
-async def broadcast_event(event: ProtocolEvent) -> None:
-    """Broadcast an event to all connected clients."""
-    if not connected_clients:
-        return
+# The educational text catalog is constant, so it's serialized once here and
+# served from a dedicated endpoint; event frames carry only the dynamic
+# fields and the client joins the text by event type.
+_EVENT_INFO_BYTES = orjson.dumps(UCP_EVENT_INFO)
+
+# Broadcast coalescing: agent tool loops can emit bursts of events, and one
+# WebSocket frame per event wastes framing bytes, syscalls, and client-side
+# parses. Events wait at most BATCH_MS (or until BATCH_MAX accumulate) and a
+# burst goes out as a single {"type": "events"} frame.
+BATCH_MS = 0.005
+BATCH_MAX = 32
+
+# Bounded so a stalled broadcaster gives bounded memory during bursts;
+# visualizer events are best-effort, so overflow drops rather than blocks.
+_broadcast_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
 
-    message = json.dumps(
-        {
-            "type": "event",
-            "data": format_event_for_display(event),
-        }
+# Loop running the broadcaster, captured at startup: agent events arrive
+# from the capture daemon thread, and waking the queue's waiter is only
+# safe via call_soon_threadsafe on this loop.
+_broadcast_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def _send_to_all(message: bytes) -> None:
+    """Send one frame to every client concurrently.
+
+    Total latency is the slowest client's, not the sum, and one
+    backpressured client can't stall the rest of the fanout.
+    """
+    clients = tuple(connected_clients)
+    results = await asyncio.gather(
+        *(client.send_bytes(message) for client in clients),
+        return_exceptions=True,
     )
 
-    # Send to all clients
-    disconnected = set()
-    for client in connected_clients:
-        try:
-            await client.send_text(message)
-        except Exception:
-            disconnected.add(client)
+    # Drop clients whose send failed; discard() is safe even if the
+    # client already removed itself while the sends were in flight.
+    for client, result in zip(clients, results):
+        if isinstance(result, BaseException):
+            connected_clients.discard(client)
+
+
+async def broadcast_events(events: list[ProtocolEvent]) -> None:
+    """Broadcast a batch of events to all connected clients."""
+    if not connected_clients or not events:
+        return
+
+    if len(events) == 1:
+        message = event_frame(events[0])
+    else:
+        message = orjson.dumps(
+            {
+                "type": "events",
+                "data": [display_payload(e) for e in events],
+            }
+        )
+    await _send_to_all(message)
+
+
+async def event_broadcaster() -> None:
+    """Drain the broadcast queue, coalescing bursts into single frames.
+
+    Started from the application lifespan; one instance drains for all
+    subscribers.
+    """
+    global _broadcast_loop
+    loop = asyncio.get_running_loop()
+    _broadcast_loop = loop
+    while True:
+        batch = [await _broadcast_queue.get()]
+        deadline = loop.time() + BATCH_MS
+        while len(batch) < BATCH_MAX:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(
+                    await asyncio.wait_for(_broadcast_queue.get(), timeout)
+                )
+            except asyncio.TimeoutError:
+                break
+        await broadcast_events(batch)
+
 
-    # Remove disconnected clients
-    connected_clients.difference_update(disconnected)
+def _enqueue(event: ProtocolEvent) -> None:
+    """Put an event on the broadcast queue; runs on the broadcaster's loop."""
+    try:
+        _broadcast_queue.put_nowait(event)
+    except asyncio.QueueFull:
+        logger.warning("Broadcast queue full; dropping event %s", event.id)
 
 
 def on_event(event: ProtocolEvent) -> None:
-    """Callback for new events - schedules broadcast."""
-    asyncio.create_task(broadcast_event(event))
+    """Callback for new events - queues the event for broadcast.
 
+    Called from request handlers on the event loop and from the capture
+    daemon thread for agent events, so the handoff must go through
+    call_soon_threadsafe rather than touching the queue directly.
+    """
+    if not connected_clients:
+        return
+    loop = _broadcast_loop
+    if loop is None:
+        return
+    try:
+        loop.call_soon_threadsafe(_enqueue, event)
+    except RuntimeError:
+        # Loop already closed (shutdown); nothing to broadcast to.
+        pass
 
-# Clear any existing subscribers before subscribing (handles hot-reload)
-# This ensures only one broadcast callback is registered
-event_store._subscribers.clear()
+
+# Subscribers are weakly referenced, so a stale on_event from a previous
+# hot-reload disappears with its module; no manual clearing needed
 event_store.subscribe(on_event)
 
 
@@ -64,23 +158,18 @@ async def websocket_events(websocket: WebSocket) -> None:
 
     try:
         # Send initial state
-        await websocket.send_text(
-            json.dumps(
-                {
-                    "type": "connected",
-                    "message": "Connected to UCP event stream",
-                }
-            )
-        )
+        await websocket.send_bytes(_CONNECTED_FRAME)
 
-        # Send recent events
+        # Replay recent events as one events_list frame instead of a frame
+        # per event; the payload dicts are the memoized ones shared with
+        # broadcast, so a reconnect storm doesn't re-format anything.
         recent_events = event_store.get_events(limit=20)
-        for event in recent_events:
-            await websocket.send_text(
-                json.dumps(
+        if recent_events:
+            await websocket.send_bytes(
+                orjson.dumps(
                     {
-                        "type": "event",
-                        "data": format_event_for_display(event),
+                        "type": "events_list",
+                        "data": [display_payload(e) for e in recent_events],
                     }
                 )
             )
@@ -96,37 +185,28 @@ async def websocket_events(websocket: WebSocket) -> None:
 
                 # Handle commands
                 try:
-                    message = json.loads(data)
+                    message = orjson.loads(data)
                     if message.get("type") == "ping":
-                        await websocket.send_text(json.dumps({"type": "pong"}))
+                        await websocket.send_bytes(_PONG_FRAME)
                     elif message.get("type") == "get_events":
                         events = event_store.get_events(limit=message.get("limit", 50))
-                        await websocket.send_text(
-                            json.dumps(
+                        await websocket.send_bytes(
+                            orjson.dumps(
                                 {
                                     "type": "events_list",
-                                    "data": [
-                                        format_event_for_display(e) for e in events
-                                    ],
+                                    "data": [display_payload(e) for e in events],
                                 }
                             )
                         )
                     elif message.get("type") == "clear":
                         event_store.clear()
-                        await websocket.send_text(
-                            json.dumps(
-                                {
-                                    "type": "cleared",
-                                    "message": "Event store cleared",
-                                }
-                            )
-                        )
-                except json.JSONDecodeError:
+                        await websocket.send_bytes(_CLEARED_FRAME)
+                except orjson.JSONDecodeError:
                     pass
 
             except asyncio.TimeoutError:
                 # Send keepalive
-                await websocket.send_text(json.dumps({"type": "keepalive"}))
+                await websocket.send_bytes(_KEEPALIVE_FRAME)
 
     except WebSocketDisconnect:
         pass
@@ -134,12 +214,25 @@ async def websocket_events(websocket: WebSocket) -> None:
         connected_clients.discard(websocket)
 
 
+@router.get("/api/v1/event-info")
+async def get_event_info() -> Response:
+    """Return the static educational text for each event type.
+
+    Fetched once per client session; events reference it by ``type``.
+    """
+    return Response(
+        content=_EVENT_INFO_BYTES,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=86400, immutable"},
+    )
+
+
 @router.get("/api/v1/events")
 async def get_events(limit: int = 50) -> dict:
     """Get recent protocol events via REST."""
     events = event_store.get_events(limit=limit)
     return {
-        "events": [format_event_for_display(e) for e in events],
+        "events": [display_payload(e) for e in events],
         "count": len(events),
     }
 
@@ -11,7 +11,7 @@ interface ToolCall {
   id: string
   name: string
   args: Record<string, unknown>
-  timestamp: string
+  timestamp: number
   result?: {
     success: boolean
     data: Record<string, unknown>
@@ -67,7 +67,7 @@ function ToolCallItem({ toolCall, isLast }: { toolCall: ToolCall; isLast: boolea
               {TOOL_DESCRIPTIONS[toolCall.name] || toolCall.name}
             </span>
             <span className="text-xs text-gray-400 flex-shrink-0">
-              {new Date(toolCall.timestamp).toLocaleTimeString()}
+              {new Date(toolCall.timestamp * 1000).toLocaleTimeString()}
             </span>
           </button>
 
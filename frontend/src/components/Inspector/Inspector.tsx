@@ -126,7 +126,7 @@ export default function Inspector({ event }: InspectorProps) {
         <h3 className="font-medium text-gray-900 mb-2">Metadata</h3>
         <MetadataRow label="Event ID" value={event.id} />
         <MetadataRow label="Type" value={event.type} />
-        <MetadataRow label="Timestamp" value={new Date(event.timestamp).toLocaleString()} />
+        <MetadataRow label="Timestamp" value={new Date(event.timestamp * 1000).toLocaleString()} />
         <MetadataRow label="Status Code" value={event.status_code} />
         <MetadataRow label="Duration" value={event.duration_ms ? `${event.duration_ms}ms` : undefined} />
       </div>
@@ -48,7 +48,7 @@ function getStatusIcon(statusCode?: number) {
 
 function EventCard({ event, onClick }: { event: ProtocolEvent; onClick?: () => void }) {
   const isRequest = event.direction === 'request'
-  const timestamp = new Date(event.timestamp).toLocaleTimeString()
+  const timestamp = new Date(event.timestamp * 1000).toLocaleTimeString()
   const conceptColor = event.ucp_concept ? conceptColors[event.ucp_concept] || 'bg-gray-100 text-gray-700' : ''
 
   return (
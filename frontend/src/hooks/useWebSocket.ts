@@ -1,6 +1,19 @@
 import { useState, useEffect, useCallback, useRef } from 'react'
 import { ProtocolEvent } from '../types/ucp'
 
+// The server sends binary (UTF-8 JSON) frames; reuse one decoder for all of them
+const utf8Decoder = new TextDecoder()
+
+// Static educational text per event type, fetched once from the server and
+// joined onto events client-side (frames carry only the dynamic fields)
+interface EventInfo {
+  title?: string
+  description?: string
+  details?: string
+  ucp_concept?: string
+  learn_more?: string
+}
+
 interface UseWebSocketReturn {
   events: ProtocolEvent[]
   isConnected: boolean
@@ -13,10 +26,31 @@ export function useWebSocket(url: string): UseWebSocketReturn {
   const [isConnected, setIsConnected] = useState(false)
   const wsRef = useRef<WebSocket | null>(null)
   const reconnectTimeoutRef = useRef<NodeJS.Timeout | null>(null)
+  const eventInfoRef = useRef<Record<string, EventInfo>>({})
+
+  const enrich = useCallback(
+    (event: ProtocolEvent): ProtocolEvent => ({
+      ...eventInfoRef.current[event.type],
+      ...event,
+    }),
+    []
+  )
+
+  useEffect(() => {
+    fetch('http://localhost:8000/api/v1/event-info')
+      .then((res) => res.json())
+      .then((info: Record<string, EventInfo>) => {
+        eventInfoRef.current = info
+        // Backfill any events that arrived before the catalog loaded
+        setEvents((prev) => prev.map((e) => ({ ...info[e.type], ...e })))
+      })
+      .catch((err) => console.error('Failed to fetch event info:', err))
+  }, [])
 
   const connect = useCallback(() => {
     try {
       const ws = new WebSocket(url)
+      ws.binaryType = 'arraybuffer'
       wsRef.current = ws
 
       ws.onopen = () => {
@@ -26,19 +60,30 @@ export function useWebSocket(url: string): UseWebSocketReturn {
 
       ws.onmessage = (event) => {
         try {
-          const data = JSON.parse(event.data)
+          const raw =
+            typeof event.data === 'string' ? event.data : utf8Decoder.decode(event.data)
+          const data = JSON.parse(raw)
           if (data.type === 'event' && data.data) {
             // Deduplicate by event ID to prevent double-display
             // (events can arrive both as "recent" on connect and as broadcasts)
             setEvents((prev) => {
-              const newEvent = data.data as ProtocolEvent
+              const newEvent = enrich(data.data as ProtocolEvent)
               if (prev.some(e => e.id === newEvent.id)) {
                 return prev // Already have this event
               }
               return [...prev, newEvent]
             })
+          } else if (data.type === 'events' && data.data) {
+            // Coalesced burst: one frame carrying several events
+            setEvents((prev) => {
+              const seen = new Set(prev.map((e) => e.id))
+              const fresh = (data.data as ProtocolEvent[])
+                .filter((e) => !seen.has(e.id))
+                .map(enrich)
+              return fresh.length ? [...prev, ...fresh] : prev
+            })
           } else if (data.type === 'events_list' && data.data) {
-            setEvents(data.data as ProtocolEvent[])
+            setEvents((data.data as ProtocolEvent[]).map(enrich))
           }
         } catch (err) {
           console.error('Failed to parse WebSocket message:', err)
@@ -64,7 +109,7 @@ export function useWebSocket(url: string): UseWebSocketReturn {
         connect()
       }, 3000)
     }
-  }, [url])
+  }, [url, enrich])
 
   useEffect(() => {
     connect()
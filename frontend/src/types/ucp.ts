@@ -107,8 +107,6 @@ export interface PostalAddress {
   address_region?: string;
   postal_code?: string;
   address_country?: string;
-  first_name?: string;
-  last_name?: string;
 }
 
 export interface Fulfillment {
@@ -175,7 +173,8 @@ export interface ProtocolEvent {
   id: string;
   type: string;
   direction: 'request' | 'response';
-  timestamp: string;
+  /** Epoch seconds; multiply by 1000 for Date */
+  timestamp: number;
   method: string;
   path: string;
   status_code?: number;
@@ -0,0 +1,21 @@
+"""Shared fixtures for the backend test suite."""
+
+import pytest
+
+
+def pytest_sessionstart(session):
+    """Construct the application once, before any test module imports.
+
+    Importing backend.main registers every route and triggers Pydantic
+    core-schema builds; caching the instance here keeps that one-shot
+    cost at session setup, shared by every module that needs the app.
+    """
+    from backend.main import app
+
+    session._app = app
+
+
+@pytest.fixture(scope="session")
+def app(request):
+    """The FastAPI application singleton built at session start."""
+    return request.session._app
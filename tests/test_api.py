@@ -1,178 +1,192 @@
 """Tests for API endpoints."""
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
-from backend.main import app
 
+def _json(response):
+    """Parse a response body with orjson (faster than response.json())."""
+    return orjson.loads(response.content)
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
+
+# Checkout request bodies, serialized once at import; tests POST the raw
+# bytes instead of re-building and re-encoding the same dicts per test.
+_JSON_HEADERS = {"content-type": "application/json"}
+_LATTE1 = orjson.dumps(
+    {"line_items": [{"product_id": "latte_medium", "quantity": 1}]}
+)
+_LATTE2 = orjson.dumps(
+    {"line_items": [{"product_id": "latte_medium", "quantity": 2}]}
+)
+_LATTE1_PICKUP = orjson.dumps(
+    {
+        "line_items": [{"product_id": "latte_medium", "quantity": 1}],
+        "fulfillment": {"selected_option_id": "pickup"},
+    }
+)
+_LATTE1_DEMO20 = orjson.dumps(
+    {
+        "line_items": [{"product_id": "latte_medium", "quantity": 1}],
+        "discount_codes": ["DEMO20"],
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """One test client for the whole suite.
+
+    The app comes from the session-start cache in conftest and each
+    checkout test creates its own session, so nothing here needs per-test
+    isolation; the context manager runs the lifespan exactly once.
+    """
+    with TestClient(app) as c:
+        yield c
+
+
+# The discovery/products/health endpoints are read-only, so one request per
+# module is enough; each test asserts against the shared response.
+@pytest.fixture(scope="module")
+def discovery_response(client):
+    """Fetch the discovery profile once for all discovery tests."""
+    return client.get("/.well-known/ucp")
+
+
+@pytest.fixture(scope="module")
+def products_response(client):
+    """Fetch the product list once for all products tests."""
+    return client.get("/api/v1/products")
+
+
+@pytest.fixture(scope="module")
+def health_response(client):
+    """Fetch the health check once for all health tests."""
+    return client.get("/health")
 
 
 class TestDiscoveryEndpoint:
     """Tests for UCP discovery endpoint."""
 
-    def test_discovery_returns_200(self, client):
+    def test_discovery_returns_200(self, discovery_response):
         """Discovery endpoint should return 200."""
-        response = client.get("/.well-known/ucp")
-        assert response.status_code == 200
+        assert discovery_response.status_code == 200
 
-    def test_discovery_has_ucp_metadata(self, client):
+    def test_discovery_has_ucp_metadata(self, discovery_response):
         """Discovery response should have UCP metadata."""
-        response = client.get("/.well-known/ucp")
-        data = response.json()
+        data = _json(discovery_response)
         assert "ucp" in data
         assert "version" in data["ucp"]
 
-    def test_discovery_has_capabilities(self, client):
+    def test_discovery_has_capabilities(self, discovery_response):
         """Discovery should list capabilities."""
-        response = client.get("/.well-known/ucp")
-        data = response.json()
+        data = _json(discovery_response)
         assert "capabilities" in data["ucp"]
         # Should have checkout capability
         assert "dev.ucp.shopping.checkout" in data["ucp"]["capabilities"]
 
-    def test_discovery_has_payment_handlers(self, client):
+    def test_discovery_has_payment_handlers(self, discovery_response):
         """Discovery should list payment handlers."""
-        response = client.get("/.well-known/ucp")
-        data = response.json()
+        data = _json(discovery_response)
         assert "payment_handlers" in data["ucp"]
 
 
 class TestProductsEndpoint:
     """Tests for products endpoint."""
 
-    def test_get_products_returns_200(self, client):
+    def test_get_products_returns_200(self, products_response):
         """Products endpoint should return 200."""
-        response = client.get("/api/v1/products")
-        assert response.status_code == 200
+        assert products_response.status_code == 200
 
-    def test_get_products_returns_list(self, client):
+    def test_get_products_returns_list(self, products_response):
         """Products endpoint should return a list."""
-        response = client.get("/api/v1/products")
-        data = response.json()
+        data = _json(products_response)
         assert isinstance(data, list)
         assert len(data) > 0
 
-    def test_products_have_required_fields(self, client):
+    def test_products_have_required_fields(self, products_response):
         """Each product should have required fields."""
-        response = client.get("/api/v1/products")
-        data = response.json()
+        data = _json(products_response)
         for product in data:
             assert "id" in product
             assert "title" in product
             assert "price" in product
 
 
+@pytest.fixture
+def latte_checkout_id(client):
+    """Create a one-latte checkout session and return its id.
+
+    Function-scoped: the update tests mutate their session, so each test
+    gets its own.
+    """
+    response = client.post(
+        "/api/v1/checkout-sessions", content=_LATTE1, headers=_JSON_HEADERS
+    )
+    return _json(response)["id"]
+
+
 class TestCheckoutEndpoints:
     """Tests for checkout endpoints."""
 
     def test_create_checkout_returns_200(self, client):
         """Create checkout should return 200."""
         response = client.post(
-            "/api/v1/checkout-sessions",
-            json={
-                "line_items": [{"product_id": "latte_medium", "quantity": 1}]
-            },
+            "/api/v1/checkout-sessions", content=_LATTE1, headers=_JSON_HEADERS
         )
         assert response.status_code == 200
 
-    def test_create_checkout_returns_session(self, client):
-        """Create checkout should return session with ID."""
+    @pytest.mark.parametrize(
+        "payload,subtotal",
+        [
+            pytest.param(_LATTE1, 549, id="one-latte"),
+            pytest.param(_LATTE2, 1098, id="two-lattes"),
+        ],
+    )
+    def test_create_checkout_returns_session(self, client, payload, subtotal):
+        """Create checkout should return a session with calculated totals."""
         response = client.post(
-            "/api/v1/checkout-sessions",
-            json={
-                "line_items": [{"product_id": "latte_medium", "quantity": 1}]
-            },
+            "/api/v1/checkout-sessions", content=payload, headers=_JSON_HEADERS
         )
-        data = response.json()
+        data = _json(response)
         assert "id" in data
-        assert "status" in data
         assert "line_items" in data
         assert data["status"] == "incomplete"
+        assert data["totals"]["subtotal"] == subtotal
 
-    def test_create_checkout_calculates_totals(self, client):
-        """Create checkout should calculate totals."""
-        response = client.post(
-            "/api/v1/checkout-sessions",
-            json={
-                "line_items": [{"product_id": "latte_medium", "quantity": 2}]
-            },
-        )
-        data = response.json()
-        assert "totals" in data
-        assert data["totals"]["subtotal"] == 1098  # 549 * 2
-
-    def test_get_checkout_returns_session(self, client):
+    def test_get_checkout_returns_session(self, client, latte_checkout_id):
         """Get checkout should return existing session."""
-        # Create first
-        create_response = client.post(
-            "/api/v1/checkout-sessions",
-            json={
-                "line_items": [{"product_id": "coffee_small", "quantity": 1}]
-            },
-        )
-        checkout_id = create_response.json()["id"]
-
-        # Get it back
-        get_response = client.get(f"/api/v1/checkout-sessions/{checkout_id}")
+        get_response = client.get(f"/api/v1/checkout-sessions/{latte_checkout_id}")
         assert get_response.status_code == 200
-        assert get_response.json()["id"] == checkout_id
+        assert _json(get_response)["id"] == latte_checkout_id
 
     def test_get_checkout_not_found(self, client):
         """Get checkout should return 404 for non-existent session."""
         response = client.get("/api/v1/checkout-sessions/nonexistent-id")
         assert response.status_code == 404
 
-    def test_update_checkout_with_fulfillment(self, client):
+    def test_update_checkout_with_fulfillment(self, client, latte_checkout_id):
         """Update checkout should accept fulfillment selection."""
-        # Create first
-        create_response = client.post(
-            "/api/v1/checkout-sessions",
-            json={
-                "line_items": [{"product_id": "latte_medium", "quantity": 1}]
-            },
-        )
-        checkout_id = create_response.json()["id"]
-
-        # Update with fulfillment
         update_response = client.put(
-            f"/api/v1/checkout-sessions/{checkout_id}",
-            json={
-                "line_items": [{"product_id": "latte_medium", "quantity": 1}],
-                "fulfillment": {"selected_option_id": "pickup"},
-            },
+            f"/api/v1/checkout-sessions/{latte_checkout_id}",
+            content=_LATTE1_PICKUP,
+            headers=_JSON_HEADERS,
         )
         assert update_response.status_code == 200
-        data = update_response.json()
+        data = _json(update_response)
         assert data["fulfillment"]["selected_option_id"] == "pickup"
         # With pickup selected, should be ready for complete
         assert data["status"] == "ready_for_complete"
 
-    def test_update_checkout_with_discount(self, client):
+    def test_update_checkout_with_discount(self, client, latte_checkout_id):
         """Update checkout should apply valid discount codes."""
-        # Create first
-        create_response = client.post(
-            "/api/v1/checkout-sessions",
-            json={
-                "line_items": [{"product_id": "latte_medium", "quantity": 1}]
-            },
-        )
-        checkout_id = create_response.json()["id"]
-
-        # Update with discount
         update_response = client.put(
-            f"/api/v1/checkout-sessions/{checkout_id}",
-            json={
-                "line_items": [{"product_id": "latte_medium", "quantity": 1}],
-                "discount_codes": ["DEMO20"],
-            },
+            f"/api/v1/checkout-sessions/{latte_checkout_id}",
+            content=_LATTE1_DEMO20,
+            headers=_JSON_HEADERS,
         )
         assert update_response.status_code == 200
-        data = update_response.json()
+        data = _json(update_response)
         assert len(data["discounts"]) == 1
         assert data["discounts"][0]["code"] == "DEMO20"
 
@@ -180,13 +194,11 @@ class TestCheckoutEndpoints:
 class TestHealthEndpoint:
     """Tests for health check endpoint."""
 
-    def test_health_returns_200(self, client):
+    def test_health_returns_200(self, health_response):
         """Health endpoint should return 200."""
-        response = client.get("/health")
-        assert response.status_code == 200
+        assert health_response.status_code == 200
 
-    def test_health_returns_healthy(self, client):
+    def test_health_returns_healthy(self, health_response):
         """Health endpoint should return healthy status."""
-        response = client.get("/health")
-        data = response.json()
+        data = _json(health_response)
         assert data["status"] == "healthy"
@@ -13,6 +13,12 @@ from backend.business.catalog import (
 )
 
 
+@pytest.fixture(scope="session")
+def all_products():
+    """The full product list, materialized once for the suite."""
+    return get_all_products()
+
+
 class TestCatalog:
     """Tests for catalog functions."""
 
@@ -33,20 +39,19 @@ class TestCatalog:
         product = get_product("nonexistent_product")
         assert product is None
 
-    def test_get_all_products(self):
+    def test_get_all_products(self, all_products):
         """Should return all products."""
-        products = get_all_products()
-        assert len(products) == len(CATALOG)
-        assert all(hasattr(p, "id") for p in products)
-        assert all(hasattr(p, "price") for p in products)
+        assert len(all_products) == len(CATALOG)
+        assert all(hasattr(p, "id") for p in all_products)
+        assert all(hasattr(p, "price") for p in all_products)
 
-    def test_product_has_required_fields(self):
-        """All products should have required fields."""
-        for product_id, product in CATALOG.items():
-            assert product.id == product_id
-            assert product.title
-            assert product.price > 0
-            assert product.currency == "USD"
+    @pytest.mark.parametrize("product_id,product", list(CATALOG.items()))
+    def test_product_has_required_fields(self, product_id, product):
+        """Every product should have required fields."""
+        assert product.id == product_id
+        assert product.title
+        assert product.price > 0
+        assert product.currency == "USD"
 
 
 class TestDiscountCodes:
@@ -60,11 +65,10 @@ class TestDiscountCodes:
         assert discount["type"] == "percentage"
         assert discount["value"] == 20
 
-    def test_discount_code_case_insensitive(self):
+    @pytest.mark.parametrize("code", ["demo20", "Demo20", "DEMO20"])
+    def test_discount_code_case_insensitive(self, code):
         """Discount codes should be case-insensitive."""
-        assert validate_discount_code("demo20") is not None
-        assert validate_discount_code("Demo20") is not None
-        assert validate_discount_code("DEMO20") is not None
+        assert validate_discount_code(code) is not None
 
     def test_invalid_discount_code(self):
         """Should return None for invalid codes."""
@@ -73,10 +77,18 @@ class TestDiscountCodes:
 
     def test_all_discount_codes_have_required_fields(self):
         """All discount codes should have required fields."""
-        for code, details in DISCOUNT_CODES.items():
-            assert "title" in details
-            assert "type" in details
-            assert "value" in details
+        bad = [
+            code
+            for code, details in DISCOUNT_CODES.items()
+            if not ("title" in details and "type" in details and "value" in details)
+        ]
+        assert not bad, bad
+
+
+@pytest.fixture(scope="module")
+def options_by_id():
+    """Fulfillment options indexed by id for O(1) lookups in tests."""
+    return {o["id"]: o for o in get_fulfillment_options()}
 
 
 class TestFulfillmentOptions:
@@ -87,17 +99,19 @@ class TestFulfillmentOptions:
         options = get_fulfillment_options()
         assert len(options) >= 1
 
-    def test_pickup_option_is_free(self):
+    def test_pickup_option_is_free(self, options_by_id):
         """Pickup option should be free."""
-        options = get_fulfillment_options()
-        pickup = next((o for o in options if o["id"] == "pickup"), None)
-        assert pickup is not None
-        assert pickup["price"] == 0
+        assert options_by_id["pickup"]["price"] == 0
 
     def test_all_options_have_required_fields(self):
         """All fulfillment options should have required fields."""
-        for option in FULFILLMENT_OPTIONS:
-            assert "id" in option
-            assert "title" in option
-            assert "price" in option
-            assert option["price"] >= 0
+        bad = [
+            option.get("id")
+            for option in FULFILLMENT_OPTIONS
+            if not (
+                "id" in option
+                and "title" in option
+                and option.get("price", -1) >= 0
+            )
+        ]
+        assert not bad, bad